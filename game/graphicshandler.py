@@ -28,7 +28,7 @@ class GraphicsHandler:
         self._initialize_window()
 
     def load_resources(self, resource_config):
-        resources = self._resource_loader.load(resource_config)
+        resources = self._resource_loader.load_parallel(resource_config)
         self._resource_map = resources
 
     @staticmethod
@@ -55,6 +55,7 @@ Versioning scheme based on: http://en.wikipedia.org/wiki/Versioning#Designating_
 import xml.sax
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 __version__ = '4.0.0.0'
 
@@ -345,6 +346,27 @@ def _get_abs_path_of_relative_path(base_path, relative_path):
     return os.path.normpath(relative_path)
 
 
+class _MapNode(object):
+    """A map or tileset element on the Handler stack, converted to its json dict once the element ends."""
+    __slots__ = ('attrs', 'layers', 'properties', 'tilesets')
+
+    def __init__(self, attrs, layers=None, tilesets=None):
+        self.attrs = attrs  # {string : value}
+        self.layers = layers  # only for the map
+        self.properties = {}  # {string : string}
+        self.tilesets = tilesets  # only for the map
+
+    def to_dict(self):
+        d = {}
+        if self.layers is not None:
+            d[_ATTR_LAYERS] = self.layers
+        d[_ELEM_PROPERTIES] = self.properties
+        if self.tilesets is not None:
+            d[_ELEM_TILESETS] = self.tilesets
+        d.update(self.attrs)
+        return d
+
+
 # noinspection PyClassicStyleClass
 class Handler(xml.sax.ContentHandler):
 
@@ -352,6 +374,7 @@ class Handler(xml.sax.ContentHandler):
         xml.sax.ContentHandler.__init__(self)
         self.file_name = None
         self.logger = logger
+        self._debug = logger.isEnabledFor(logging.DEBUG)  # avoid building the log arguments if not needed
         self.stack = []
         self.map_as_json = None
 
@@ -359,18 +382,21 @@ class Handler(xml.sax.ContentHandler):
         tsx_handler = Handler(self.logger)
         tsx_file_name = _get_abs_path_of_relative_path(self.file_name, tsx_file_name)
         tsx_handler.parse(tsx_file_name)
-        tsx_tileset = tsx_handler.stack[-1]
+        tsx_tileset = tsx_handler.stack[-1]  # _MapNode
         return tsx_tileset
 
     def startElement(self, name, attributes):
-        self.logger.debug("startElement '%s': %s", name,
-                          [(attr_name, attributes.getValue(attr_name)) for attr_name in attributes.getNames()])
+        if self._debug:
+            self.logger.debug("startElement '%s': %s", name,
+                              [(attr_name, attributes.getValue(attr_name)) for attr_name in attributes.getNames()])
         if name == _ELEM_MAP:
-            self.stack.append({_ATTR_LAYERS: [], _ELEM_PROPERTIES: {}, _ELEM_TILESETS: []})
-            _set_attributes_to_dict(self.stack[-1], attributes)
+            map_node = _MapNode({}, [], [])
+            _set_attributes_to_dict(map_node.attrs, attributes)
+            self.stack.append(map_node)
             return
         elif name == _ELEM_TILESET:
-            self.stack.append({_ELEM_PROPERTIES: {}, _ATTR_SPACING: 0, _ATTR_MARGIN: 0})
+            tileset_node = _MapNode({_ATTR_SPACING: 0, _ATTR_MARGIN: 0})
+            self.stack.append(tileset_node)
             if _ATTR_SOURCE in attributes.getNames():
                 # external tsx file
                 tsx_file_name = attributes.getValue(_ATTR_SOURCE)
@@ -378,18 +404,20 @@ class Handler(xml.sax.ContentHandler):
                 tsx_tileset = self.parse_tsx_file(tsx_file_name)
 
                 # TODO: is there a simpler way to get the relative path to tmx files?
-                image_path_rel_to_tsx = tsx_tileset[_ELEM_IMAGE]
+                image_path_rel_to_tsx = tsx_tileset.attrs[_ELEM_IMAGE]
                 tsx_file_name = _get_abs_path_of_relative_path(self.file_name, tsx_file_name)
                 abs_tmx_path = os.path.dirname(os.path.abspath(self.file_name))
                 image_path = _get_abs_path_of_relative_path(tsx_file_name, image_path_rel_to_tsx)
                 rel_path = os.path.relpath(image_path, abs_tmx_path)
                 rel_path = os.path.normpath(rel_path).replace(os.sep, "/")  # simple slash as separator!
-                tsx_tileset[_ELEM_IMAGE] = rel_path
+                tsx_tileset.attrs[_ELEM_IMAGE] = rel_path
 
-                self.stack[-1].update(tsx_tileset)
-                self.stack[-1][_ATTR_FIRST_GID] = _convert_type(_ATTR_FIRST_GID, attributes.getValue(_ATTR_FIRST_GID))
+                tileset_node.attrs.update(tsx_tileset.attrs)
+                tileset_node.properties = tsx_tileset.properties
+                tileset_node.attrs[_ATTR_FIRST_GID] = _convert_type(_ATTR_FIRST_GID,
+                                                                    attributes.getValue(_ATTR_FIRST_GID))
             else:
-                _set_attributes_to_dict(self.stack[-1], attributes)
+                _set_attributes_to_dict(tileset_node.attrs, attributes)
             return
         elif name == _ELEM_PROPERTIES:
             properties = {}
@@ -401,7 +429,7 @@ class Handler(xml.sax.ContentHandler):
             parent_properties[attributes.getValue(_ATTR_NAME)] = attributes.getValue(_ATTR_VALUE)
             return
         elif name == _ELEM_IMAGE:
-            parent_tileset = self.stack[-1]
+            parent_tileset = self.stack[-1].attrs
             parent_tileset[_ELEM_IMAGE] = _convert_type(_ATTR_SOURCE, attributes.getValue(_ATTR_SOURCE))
             # optional, may not be present
             if _ATTR_WIDTH in attributes.getNames():
@@ -419,9 +447,10 @@ class Handler(xml.sax.ContentHandler):
         self.logger.warn("startElement '%s' was unhandled!", name)
 
     def endElement(self, name):
-        self.logger.debug("endElement '%s'", name)
+        if self._debug:
+            self.logger.debug("endElement '%s'", name)
         if name == _ELEM_MAP:
-            self.map_as_json = self.stack[-1]
+            self.map_as_json = self.stack[-1].to_dict()
             return
         elif name == _ELEM_TILESET:
             if len(self.stack) <= 1:
@@ -429,11 +458,11 @@ class Handler(xml.sax.ContentHandler):
                 pass
             else:
                 tileset = self.stack.pop()
-                self.stack[-1].get(_ELEM_TILESETS, []).append(tileset)
+                self.stack[-1].tilesets.append(tileset.to_dict())
             return
         elif name == _ELEM_PROPERTIES:
             properties = self.stack.pop()
-            self.stack[-1][_ELEM_PROPERTIES] = properties
+            self.stack[-1].properties = properties
             return
         elif name == _ELEM_PROPERTY:
             return
@@ -441,19 +470,22 @@ class Handler(xml.sax.ContentHandler):
             return
         elif name == _ELEM_TILE_OFFSET:
             tile_offset = self.stack.pop()
-            self.stack[-1][_ELEM_TILE_OFFSET] = tile_offset
+            self.stack[-1].attrs[_ELEM_TILE_OFFSET] = tile_offset
             return
 
         self.logger.warn("endElement '%s' was unhandled", name)
 
     def startDocument(self):
-        self.logger.debug("start document " + self.file_name)
+        if self._debug:
+            self.logger.debug("start document %s", self.file_name)
 
     def endDocument(self):
-        self.logger.debug("end document " + self.file_name)
+        if self._debug:
+            self.logger.debug("end document %s", self.file_name)
 
     def characters(self, content):
-        self.logger.debug("content: %s", content)
+        if self._debug:
+            self.logger.debug("content: %s", content)
         return
         # self.logger.warn("content was unhandled: %s", content)
 
@@ -470,12 +502,66 @@ def convert_tmx_to_json(tmx_file_to_parse, logger=None):
     :param logger: the logger instance to use.
     :return: json string.
     """
-    logging.basicConfig(level=logging.INFO)  # make sure that the root logger has DEBUG level set
     logger = logger or logging.getLogger(__name__)
     handler = Handler(logger)
 
     return handler.parse(tmx_file_to_parse)
 
+
+def convert_tmx_batch(tmx_files_to_parse, max_workers=None, logger=None):
+    """
+    Converts many tmx files using a thread pool, see convert_tmx_to_json.
+    :param tmx_files_to_parse: the tmx files to parse.
+    :param max_workers: number of worker threads, see ThreadPoolExecutor.
+    :param logger: the logger instance to use.
+    :return: list of the converted maps in the same order as the files.
+    """
+    with ThreadPoolExecutor(max_workers) as pool:
+        return list(pool.map(lambda file_name: convert_tmx_to_json(file_name, logger), tmx_files_to_parse))
+
+
+EVENT_START = 'start'
+EVENT_END = 'end'
+
+
+class _EventHandler(xml.sax.ContentHandler):
+    """Forwards the sax element callbacks as (event, name, attributes) tuples."""
+
+    def __init__(self, emit):
+        xml.sax.ContentHandler.__init__(self)
+        self._emit = emit
+
+    def startElement(self, name, attributes):
+        self._emit((EVENT_START, name, {k: _convert_type(k, v) for k, v in attributes.items()}))
+
+    def endElement(self, name):
+        self._emit((EVENT_END, name, None))
+
+
+def iter_tmx(tmx_file_to_parse, chunk_size=64 * 1024):
+    """
+    Iterates over the elements of a tmx file without building the json dict.
+
+    Yields (EVENT_START, name, attributes) and (EVENT_END, name, None) tuples in document order, the attribute
+    values are converted the same way as in convert_tmx_to_json. External tsx files referenced by a tileset
+    'source' attribute are not resolved.
+    :param tmx_file_to_parse: the tmx file to parse.
+    :param chunk_size: number of bytes fed to the parser at once.
+    :return: generator of event tuples.
+    """
+    events = []
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(_EventHandler(events.append))
+    with open(tmx_file_to_parse, 'rb') as f:
+        chunk = f.read(chunk_size)
+        while chunk:
+            parser.feed(chunk)
+            yield from events
+            events.clear()
+            chunk = f.read(chunk_size)
+    parser.close()
+    yield from events
+
 #
 # if __name__ == "__main__":
 # import sys
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+import itertools
 import logging
 import os
+from typing import Final
 
 from game import settings
 from game.resourcespygame import (
@@ -28,51 +30,45 @@ FID = FakeImageDescription
 SRD = SoundResourceDescription
 MRD = MusicResourceDescription
 
-_res_id = 1000
-
-
-def next_id():
-    global _res_id
-    _res_id += 1
-    return _res_id
-
-
-res_id_ship = next_id()
-res_id_powerup = next_id()
-res_id_mine = next_id()
-res_id_enemy_easy = next_id()
-res_id_enemy_medium = next_id()
-res_id_enemy_hard = next_id()
-res_id_cannon = next_id()
-res_id_enemy_bullet = next_id()
-res_id_enemy_medium_bullet = next_id()
-res_id_enemy_hard_bullet = next_id()
-res_id_friend_bullet = next_id()
-res_id_portal_start = next_id()
-res_id_portal_end = next_id()
-res_id_pointer = next_id()
-res_id_ship_explode = next_id()
-res_id_bullet_ship_explosion = next_id()
-res_id_bullet_enemy_explosion = next_id()
-res_id_ship_wall_sparks = next_id()
-res_id_bullet_wall_hit = next_id()
-
-res_id_music_1 = next_id()
-res_id_music_2 = next_id()
-
-res_id_sound_fire_1 = next_id()
-res_id_sound_fire_2 = next_id()
-res_id_sound_fire_3 = next_id()
-res_id_sound_fire_4 = next_id()
-res_id_sound_fire_5 = next_id()
-res_id_sound_fire_6 = next_id()
-res_id_sound_game_over = next_id()
-res_id_sound_hit = next_id()
-res_id_sound_no_bullet = next_id()
-res_id_sound_misc_lasers = next_id()  # do not use; this is a composite sample of alternative sounds
-res_id_sound_start_level = next_id()
-res_id_sound_ship_explode = next_id()  # 3 sec max
-res_id_sound_enemy_explode = next_id()  # 3 sec max
+# shared id sequence (also used by game.events), first id is 1001
+next_id = itertools.count(1001).__next__
+
+res_id_ship: Final[int] = next_id()
+res_id_powerup: Final[int] = next_id()
+res_id_mine: Final[int] = next_id()
+res_id_enemy_easy: Final[int] = next_id()
+res_id_enemy_medium: Final[int] = next_id()
+res_id_enemy_hard: Final[int] = next_id()
+res_id_cannon: Final[int] = next_id()
+res_id_enemy_bullet: Final[int] = next_id()
+res_id_enemy_medium_bullet: Final[int] = next_id()
+res_id_enemy_hard_bullet: Final[int] = next_id()
+res_id_friend_bullet: Final[int] = next_id()
+res_id_portal_start: Final[int] = next_id()
+res_id_portal_end: Final[int] = next_id()
+res_id_pointer: Final[int] = next_id()
+res_id_ship_explode: Final[int] = next_id()
+res_id_bullet_ship_explosion: Final[int] = next_id()
+res_id_bullet_enemy_explosion: Final[int] = next_id()
+res_id_ship_wall_sparks: Final[int] = next_id()
+res_id_bullet_wall_hit: Final[int] = next_id()
+
+res_id_music_1: Final[int] = next_id()
+res_id_music_2: Final[int] = next_id()
+
+res_id_sound_fire_1: Final[int] = next_id()
+res_id_sound_fire_2: Final[int] = next_id()
+res_id_sound_fire_3: Final[int] = next_id()
+res_id_sound_fire_4: Final[int] = next_id()
+res_id_sound_fire_5: Final[int] = next_id()
+res_id_sound_fire_6: Final[int] = next_id()
+res_id_sound_game_over: Final[int] = next_id()
+res_id_sound_hit: Final[int] = next_id()
+res_id_sound_no_bullet: Final[int] = next_id()
+res_id_sound_misc_lasers: Final[int] = next_id()  # do not use; this is a composite sample of alternative sounds
+res_id_sound_start_level: Final[int] = next_id()
+res_id_sound_ship_explode: Final[int] = next_id()  # 3 sec max
+res_id_sound_enemy_explode: Final[int] = next_id()  # 3 sec max
 
 hit_animation = AnimationResourceDescription(10, "resources/graphics/hit.png", (0, 0, 57, 57), 1, 3, (0, 1, 2))
 resource_config_image = {
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import abc
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -8,10 +10,10 @@ logger.debug("importing...")
 
 
 class AbstractResourceDescription(metaclass=abc.ABCMeta):
-    pass
+    __slots__ = ()  # keep the slotted descriptions free of a __dict__
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BaseResource:
     resource_description: AbstractResourceDescription
 
@@ -22,16 +24,29 @@ class AbstractBaseLoader(metaclass=abc.ABCMeta):
     def load(self, resource_description: AbstractResourceDescription) -> BaseResource:
         pass
 
+    def prefetch(self, resource_description: AbstractResourceDescription):
+        """
+        Thread safe part of loading (e.g. file I/O and decoding), called from a worker thread by
+        ResourceLoader.load_parallel. The default does nothing and leaves all work to finish.
+        :return: the data passed on to finish.
+        """
+        return None
+
+    def finish(self, resource_description: AbstractResourceDescription, prefetched) -> BaseResource:
+        """Creates the resource from the prefetched data, called on the main thread."""
+        return self.load(resource_description)
+
 
 class ResourceLoader:
 
     def __init__(self):
         self._loader_map = {}  # {res_descr: loader}
         self._resources = {}  # {res_id: resource}
+        self._lock = threading.Lock()  # guards _resources
 
     def configure_loaders(self, loader_map):
         for res_descr_type, res_loader in loader_map.items():
-            if not isinstance(res_descr_type, type(AbstractResourceDescription)):
+            if not (isinstance(res_descr_type, type) and issubclass(res_descr_type, AbstractResourceDescription)):
                 raise Exception(
                     f"Resource description '{res_descr_type}' should inherit from: {AbstractResourceDescription}")
             if not isinstance(res_loader, AbstractBaseLoader):
@@ -40,27 +55,45 @@ class ResourceLoader:
         self._loader_map = loader_map  # {type:loader}
 
     def load(self, config):
-        resources = {}
-        for res_id, desc in config.items():
+        with self._lock:
+            cache = self._resources
+            misses = [(res_id, desc) for res_id, desc in config.items() if res_id not in cache]
+            for res_id, desc in misses:
+                cache[res_id] = self._get_loader(res_id, desc).load(desc)
+
+            # keep the order of the config, e.g. the music playlist depends on it
+            return {res_id: cache[res_id] for res_id in config}
+
+    def load_parallel(self, config, max_workers=None):
+        """
+        Same as load, but the prefetch part of the loaders runs in a thread pool. This is safe because the
+        descriptions are frozen and not shared mutable state. The resources are finished on the calling thread
+        (e.g. convert_alpha needs the display).
+        :param config: the resource config, {res_id: resource_description}
+        :param max_workers: number of worker threads, see ThreadPoolExecutor.
+        :return: the resources, {res_id: resource}
+        """
+        with self._lock:
+            cache = self._resources
+            misses = [(res_id, desc, self._get_loader(res_id, desc))
+                      for res_id, desc in config.items() if res_id not in cache]
+            with ThreadPoolExecutor(max_workers) as pool:
+                prefetched = list(pool.map(lambda miss: miss[2].prefetch(miss[1]), misses))
+            for (res_id, desc, loader), data in zip(misses, prefetched):
+                cache[res_id] = loader.finish(desc, data)
+
+            return {res_id: cache[res_id] for res_id in config}
+
+    def _get_loader(self, res_id, desc):
+        # only verified description types are in the loader map, so no isinstance check is needed here
+        loader_type = type(desc)
+        loader = self._loader_map.get(loader_type, None)
+        if loader is None:
             if not isinstance(desc, AbstractResourceDescription):
                 raise Exception(f"Resource description should inherit from '{AbstractResourceDescription}' "
                                 f"but does not for resource id '{res_id}'")
-
-            if res_id in self._resources:  # check cache
-                resources[res_id] = self._resources[res_id]
-                continue
-
-            loader_type = type(desc)
-            loader = self._loader_map.get(loader_type, None)
-            if loader:
-                res = loader.load(desc)
-                if res_id in resources:
-                    raise Exception(f"Double resource id detected: {res_id}")
-                resources[res_id] = res
-                self._resources[res_id] = res
-            else:
-                raise Exception(f"Loader could not be found for type: {loader_type}")
-        return resources
+            raise Exception(f"Loader could not be found for type: {loader_type}")
+        return loader
 
 
 logger.debug("imported")
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 logger.debug("importing...")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SoundResourceDescription(AbstractResourceDescription):
     """the filename to load"""
     filename: str
@@ -24,7 +24,7 @@ class SoundResourceDescription(AbstractResourceDescription):
     replace: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SoundResource(BaseResource):
     channel_id: int
     volume: float
@@ -41,13 +41,13 @@ class SoundLoader(AbstractBaseLoader):
         return SoundResource(rd, rd.channel_id, rd.volume, rd.replace, sound)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MusicResourceDescription(AbstractResourceDescription):
     filename: str
     volume: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MusicResource(BaseResource):
     pass
 
@@ -57,7 +57,7 @@ class MusicLoader(AbstractBaseLoader):
         return MusicResource(resource_description)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageResourceDescription(AbstractResourceDescription):
     filename: str
     flip_x: bool = False
@@ -65,7 +65,7 @@ class ImageResourceDescription(AbstractResourceDescription):
     fps: float = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageResource(BaseResource):
     images: List[pygame.Surface]
     fps: float
@@ -76,18 +76,24 @@ class ImageResource(BaseResource):
 class ImageLoader(AbstractBaseLoader):
 
     def load(self, resource_description: ImageResourceDescription) -> ImageResource:
-        image = pygame.image.load(resource_description.filename).convert_alpha()
+        return self.finish(resource_description, self.prefetch(resource_description))
+
+    def prefetch(self, resource_description: ImageResourceDescription) -> pygame.Surface:
+        return pygame.image.load(resource_description.filename)
+
+    def finish(self, resource_description: ImageResourceDescription, prefetched: pygame.Surface) -> ImageResource:
+        image = prefetched.convert_alpha()
         image = pygame.transform.flip(image, resource_description.flip_x, resource_description.flip_y)
         return ImageResource(resource_description, [image], 0, False, 1)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _AnimationResourceDescription(AbstractResourceDescription):
     fps: float
     loop: bool = field(default=True, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnimationResourceDescription(_AnimationResourceDescription):
     filename: str
     rect: Tuple[int, int, int, int]
@@ -100,7 +106,13 @@ class AnimationResourceDescription(_AnimationResourceDescription):
 
 class AnimationResourceLoader(AbstractBaseLoader):
     def load(self, resource_description: AnimationResourceDescription) -> ImageResource:
-        image = pygame.image.load(resource_description.filename).convert_alpha()
+        return self.finish(resource_description, self.prefetch(resource_description))
+
+    def prefetch(self, resource_description: AnimationResourceDescription) -> pygame.Surface:
+        return pygame.image.load(resource_description.filename)
+
+    def finish(self, resource_description: AnimationResourceDescription, prefetched: pygame.Surface) -> ImageResource:
+        image = prefetched.convert_alpha()
         r = pygame.Rect(resource_description.rect)
         idx = 0
         indexed_images = {}  # {idx:image}
@@ -125,7 +137,7 @@ class AnimationResourceLoader(AbstractBaseLoader):
                              len(images))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileListResourceDescription(_AnimationResourceDescription):
     path_to_dir: str
     file_names: List[str]
@@ -135,17 +147,24 @@ class FileListResourceDescription(_AnimationResourceDescription):
 
 class FileListResourceLoader(AbstractBaseLoader):
     def load(self, resource_description: FileListResourceDescription) -> ImageResource:
+        return self.finish(resource_description, self.prefetch(resource_description))
+
+    def prefetch(self, resource_description: FileListResourceDescription) -> List[pygame.Surface]:
+        return [pygame.image.load(os.path.join(resource_description.path_to_dir, filename))
+                for filename in resource_description.file_names]
+
+    def finish(self, resource_description: FileListResourceDescription,
+               prefetched: List[pygame.Surface]) -> ImageResource:
         images = []
-        for filename in resource_description.file_names:
-            path = os.path.join(resource_description.path_to_dir, filename)
-            image = pygame.image.load(path).convert_alpha()
-            image = pygame.transform.flip(image, resource_description.flip_x, resource_description.flip_y)
+        for image in prefetched:
+            image = pygame.transform.flip(image.convert_alpha(), resource_description.flip_x,
+                                          resource_description.flip_y)
             images.append(image)
         return ImageResource(resource_description, images, resource_description.fps, resource_description.loop,
                              len(images))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DirectoryResourceDescription(_AnimationResourceDescription):
     path_to_dir: str
     extension: str = "png"
@@ -155,18 +174,25 @@ class DirectoryResourceDescription(_AnimationResourceDescription):
 
 class DirectoryResourceLoader(AbstractBaseLoader):
     def load(self, resource_description: DirectoryResourceDescription) -> ImageResource:
-        images = []
+        return self.finish(resource_description, self.prefetch(resource_description))
+
+    def prefetch(self, resource_description: DirectoryResourceDescription) -> List[pygame.Surface]:
         import glob
         search = os.path.join(resource_description.path_to_dir, f"*.{resource_description.extension}")
-        for f in sorted(glob.glob(search)):
-            image = pygame.image.load(f).convert_alpha()
-            image = pygame.transform.flip(image, resource_description.flip_x, resource_description.flip_y)
+        return [pygame.image.load(f) for f in sorted(glob.glob(search))]
+
+    def finish(self, resource_description: DirectoryResourceDescription,
+               prefetched: List[pygame.Surface]) -> ImageResource:
+        images = []
+        for image in prefetched:
+            image = pygame.transform.flip(image.convert_alpha(), resource_description.flip_x,
+                                          resource_description.flip_y)
             images.append(image)
         return ImageResource(resource_description, images, resource_description.fps, resource_description.loop,
                              len(images))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FakeImageDescription(AbstractResourceDescription):
     size: (int, int)
     color: pygame.Color
@@ -38,7 +38,6 @@ The scene manager and its related classes.
 from __future__ import print_function, division
 
 import abc
-import collections
 import logging
 
 __version__ = '1.0.0.0'
@@ -112,31 +111,27 @@ class SceneManager:
         return self._current
 
     def pop(self, count=1, transition: Transition = None):
+        stack = self._stack
+        size = len(stack)
         n = 0
-        while self._stack:
+        while size and n < count:
             n += 1
-            exited_scene = self._stack.pop()
+            exited_scene = stack.pop()
+            size -= 1
             if n == 1 and transition:
-                to_scene = None
-                if self._stack:
-                    to_scene = self._stack[-count] if count <= len(self._stack) else None
+                to_scene = stack[-count] if count <= size else None
                 transition.run(exited_scene, to_scene)
             exited_scene.exit()
-            self._current = None
-            if self._stack:
-                self._current = self._stack[-1]
+        if n:
+            # only the scene that ends up on top is resumed, not the ones popped in between
+            self._current = stack[-1] if size else None
+            if self._current:
                 self._current.resume()
-            if n >= count:
-                break
-        # if self._stack:
-        #     self._current = self._stack[-1]
-        # else:
-        #     self._current = None
         return self._current
 
     def push(self, scene, transition=None):
-        if not isinstance(scene, collections.abc.Sequence):
-            scene = [scene]
+        if not isinstance(scene, (list, tuple)):
+            scene = (scene,)
         for idx, s in enumerate(scene):
             if self._current:
                 self._current.pause()
@@ -72,14 +72,17 @@ try:
     # noinspection PyUnresolvedReferences,PyProtectedMember
     from game._custom import Settings as CustomSettings
 
-    logger.debug("Custom settings found...")
+    _debug = logger.isEnabledFor(logging.DEBUG)
+    if _debug:
+        logger.debug("Custom settings found...")
     for k, v in CustomSettings.__dict__.items():
-        if str(k).startswith("__"):
+        if k.startswith("__"):
             continue
-        if not hasattr(Settings, k):
+        if not k.startswith("_") and not hasattr(Settings, k):
             logger.warning("Custom setting found but is not in Settings: %s=%s", k, v)
         setattr(Settings, k, v)
-        logger.debug("Overwriting Settings.%s=%s", k, v)
+        if _debug:
+            logger.debug("Overwriting Settings.%s=%s", k, v)
 except ImportError:
     pass
 
@@ -71,6 +71,8 @@ class Shaker(object):
         self.max_roll = 0.1  # Maximum rotation in radians (use sparingly).
         self.trauma = 0.0  # Current shake strength.
         self.trauma_power = 2  # Trauma exponent. Use [2, 3].
+        self._offset = Vector(0, 0, 0)  # returned by update, callers should copy it
+        self._rand = random.random
 
     def add_trauma(self, amount):
         self.trauma = min(self.trauma + amount, 1.0)
@@ -78,7 +80,8 @@ class Shaker(object):
     def update(self, delta):
         # if self.target:
         # global_position = get_node(target).global_position
-        offset = Vector(0, 0, 0)
+        offset = self._offset
+        offset.update(0, 0, 0)
 
         if self.trauma:
             self.trauma = max(self.trauma - self.decay * delta, 0)
@@ -86,10 +89,19 @@ class Shaker(object):
         return offset
 
     def shake(self, offset):
-        amount = pow(self.trauma, self.trauma_power)
+        trauma = self.trauma
+        power = self.trauma_power
+        if power == 2:
+            amount = trauma * trauma
+        elif power == 3:
+            amount = trauma * trauma * trauma
+        else:
+            amount = pow(trauma, power)
         # rotation = self.max_roll * amount * rand_range(-1, 1)
-        offset.x = self.max_offset.x * amount * rand_range(-1, 1)
-        offset.y = self.max_offset.y * amount * rand_range(-1, 1)
+        rand = self._rand
+        max_offset = self.max_offset
+        offset.x = max_offset.x * amount * (rand() * 2 - 1)  # same as rand_range(-1, 1)
+        offset.y = max_offset.y * amount * (rand() * 2 - 1)
         return offset
 
 
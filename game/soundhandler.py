@@ -29,7 +29,9 @@ class SoundHandler:
 
     def __init__(self):
         self._sound_map = {}  # {resource_id : _SoundConfig}
+        self._play_map = {}  # {resource_id : (sound, reserved channel or None, replace)}, built from _sound_map
         self._master_volume = 0.5
+        self._channels = []  # [pygame.mixer.Channel], index is the channel id
 
     def initialize(self, resources):
         """
@@ -40,6 +42,7 @@ class SoundHandler:
         # filter for SoundResources!
         # put the resources into self._sound_map
         channel_ids = set()
+        debug = logger.isEnabledFor(logging.DEBUG)
         for resource_id, res in resources.items():
             if isinstance(res, SoundResource):
                 rd: SoundResourceDescription = res.resource_description
@@ -48,9 +51,10 @@ class SoundHandler:
                 conf.channel_id = -1 if conf.channel_id is None else conf.channel_id
                 channel_ids.add(res.channel_id)
                 self._sound_map[resource_id] = conf
-                logger.debug(f'SoundHandler.initialize: Added {resource_id}:{rd.filename}')
+                if debug:
+                    logger.debug('SoundHandler.initialize: Added %s:%s', resource_id, rd.filename)
             else:
-                logger.info(f'SoundHandler.initialize: Skipped {resource_id}:{res}')
+                logger.info('SoundHandler.initialize: Skipped %s:%s', resource_id, res)
 
         channel_ids.discard(None)
         num_reserved_channels = len(channel_ids)
@@ -65,6 +69,11 @@ class SoundHandler:
         actual_reserved = pygame.mixer.set_reserved(num_reserved_channels)
         if actual_reserved < num_reserved_channels:
             logger.warning("Could not reserve %s channels, only got %s", num_reserved_channels, actual_reserved)
+        self._channels = [pygame.mixer.Channel(i) for i in range(settings.Mixer.num_channels)]
+        self._apply_master_volume()
+        self._play_map = {resource_id: (conf.sound, self._channels[conf.channel_id] if conf.channel_id >= 0 else None,
+                                        conf.replace)
+                          for resource_id, conf in self._sound_map.items()}
 
     def play(self, resource_id):
         """
@@ -73,19 +82,17 @@ class SoundHandler:
         :return:
         """
         # logger.debug(f'SoundHandler.play: {self._sound_map}')
-        res = self._sound_map.get(resource_id, None)
+        # the sound has its volume set by the loader, the master volume is set on the channels
+        sound, channel, replace = self._play_map[resource_id]
         # if res is None:
         #     logger.error("Sound resource_id not loaded: %s", resource_id)
         #     return
-        sound = res.sound
-        sound.set_volume(res.volume * self._master_volume)
-        if res.channel_id >= 0:  # channel id 0 might be special here!
+        if channel is not None:
             # reserved channels
-            channel = pygame.mixer.Channel(res.channel_id)
-            if not channel.get_busy() or res.replace:
+            if replace or not channel.get_busy():
                 channel.play(sound)
         else:
-            channel = pygame.mixer.find_channel(res.replace)
+            channel = pygame.mixer.find_channel(replace)
             if channel:
                 channel.play(sound)
             else:
@@ -97,9 +104,7 @@ class SoundHandler:
         :param fade_ms: fade the volume out in ms.
         :return: None
         """
-        for i in range(settings.Mixer.num_channels):
-            ch = pygame.mixer.Channel(i)
-            ch.fadeout(fade_ms)
+        pygame.mixer.fadeout(fade_ms)  # all channels at once
 
     def set_volume(self, volume: float):
         """
@@ -111,28 +116,15 @@ class SoundHandler:
         volume = volume if volume <= 1.0 else 1.0
         volume = volume if volume >= 0.0 else 0.0
         self._master_volume = volume
+        self._apply_master_volume()
+
+    def _apply_master_volume(self):
+        # the mixer multiplies the channel volume with the sound volume
+        for channel in self._channels:
+            channel.set_volume(self._master_volume)
 
     def get_volume(self):
         return self._master_volume
 
-    def set_end_event_type(self, end_event_type):
-        """
-        Set the end event type to be fired when the sound ends. Set to None to stop firing it.
-        :param end_event_type: the event type to fire.
-        :return: None
-        """
-        pass
-
-    def on_end_event(self):
-        """
-        Called when the end_event is registered in the event loop.
-        :return:
-        """
-        # not sure what this should do
-        pass
-
-    def update(self):
-        pass
-
 
 logger.debug("imported")
@@ -38,6 +38,7 @@ The transitions.
 from __future__ import print_function, division
 
 import logging
+import math
 
 __version__ = '1.0.0.0'
 
@@ -65,44 +66,58 @@ class FadeOutAndIn(Transition):
 
     def __init__(self, screen_provider, clock, settings, duration_in_s=0.5):
         self.settings = settings
+        self._fps = settings.draw_fps
+        self._frame_budget_ms = 1000 / self._fps
         self.total_duration_in_s = duration_in_s
         self.screen_provider = screen_provider
         self.clock = clock
+        self._fader = None  # black overlay, reused between runs, re-created if the screen size changes
+        # alpha of the fader per elapsed ms of a fade half (pygame ticks are whole ms)
+        self._half_duration_ms = self.total_duration_in_s * 1000 / 2
+        half_ms = self._half_duration_ms
+        self._fade_out_alphas = [int(255 * (t / half_ms)) for t in range(math.ceil(half_ms))]
+        self._fade_in_alphas = [int(255 * (1 - t / half_ms)) for t in range(math.ceil(half_ms))]
+
+    def _get_fader(self, screen):
+        if self._fader is None or self._fader.get_size() != screen.get_size():
+            self._fader = pygame.Surface(screen.get_size()).convert()
+            self._fader.fill((0, 0, 0))
+        return self._fader
 
     def run(self, from_scene=None, to_scene=None):
         logging.info("trans %s -> %s", from_scene, to_scene)
-        # fadeout
-        duration_ms = self.total_duration_in_s * 1000 / 2
+        if from_scene is None and to_scene is None:
+            return
         screen = self.screen_provider.get_surface()
-        fader = screen.copy()
-        fader.fill((255, 255, 255))
-        dt = 0
+        fader = self._get_fader(screen)
+        self.clock.tick(self._fps)  # reset the clock so the first frame is not skipped
+        # a half is skipped if there is no scene for it (it would only show a black screen)
+        self._fade(screen, fader, from_scene, self._fade_out_alphas)
+        self._fade(screen, fader, to_scene, self._fade_in_alphas)
+
+    def _fade(self, screen, fader, scene, alphas):
+        if not scene:
+            return
+        duration_ms = self._half_duration_ms
+        fps = self._fps
+        frame_budget_ms = self._frame_budget_ms
+        clock_tick = self.clock.tick
+        get_ticks = pygame.time.get_ticks
+        update = self.screen_provider.update  # same as flip without rects, but allows dirty rects later
         t = 0
-        self.clock.tick(self.settings.draw_fps)  # update clock so dt later is correct!
+        start = last = get_ticks()
         while t < duration_ms:
             screen.fill((0, 0, 0))
-            fraction = t / duration_ms
-            value = int(255 * (1 - fraction) + 0 * fraction)
-            fader.fill((value, value, value))
-            if from_scene:
-                from_scene.draw(screen, do_flip=False)
-            screen.blit(fader, (0, 0), None, pygame.BLEND_RGB_MULT)
-            t += dt
-            dt = self.clock.tick(self.settings.draw_fps)
-            pygame.display.flip()
-        dt = 0
-        t = 0
-        while t < duration_ms and to_scene:
-            screen.fill((0, 0, 0))
-            fraction = t / duration_ms
-            value = int(0 * (1 - fraction) + 255 * fraction)
-            fader.fill((value, value, value))
-            if to_scene:
-                to_scene.draw(screen, do_flip=False)
-            screen.blit(fader, (0, 0), None, pygame.BLEND_RGB_MULT)
-            t += dt
-            dt = self.clock.tick(self.settings.draw_fps)
-            pygame.display.flip()
+            fader.set_alpha(alphas[t])
+            scene.draw(screen, do_flip=False)
+            screen.blit(fader, (0, 0))
+            update()
+            now = get_ticks()
+            if now - last < frame_budget_ms:
+                clock_tick(fps)  # only wait if there is time left in this frame
+                now = get_ticks()
+            last = now
+            t = now - start
 
 
 logger.debug("imported")
@@ -124,6 +124,27 @@ should simplify the handling of multiple tweens and their callbacks and their ex
     nested3.start()
 
 
+Each tween is updated on its own (one ease function call and one attribute write per tween and update). For many
+values animated the same way, e.g. thousands of particles, it is much cheaper to keep them in arrays and compute all
+of them at once with :py:meth:`tween_at`. With numpy installed this uses the vectorized ease functions (see
+vectorized_ease_functions), so the cost is one call per ease function instead of one per value.
+
+.. code:: python
+
+    # particles.x, particles.start_x and particles.dx are numpy arrays, elapsed is the time since the burst
+    particles.x = tween_at(particles.start_x, particles.dx, elapsed, 2.0, ease_out_quad)
+
+
+In the same way, when two coordinates move with the same ease function, tween them as one vector attribute instead of
+one tween per coordinate. The values are copied with begin * 1.0, so anything supporting + and * with floats
+works (e.g. pygame.Vector2 for a position), and each update evaluates the ease and writes the attribute only once.
+
+.. code:: python
+
+    # instead of tweening sprite.rect.centerx and sprite.rect.centery
+    tweener.create_tween(sprite, "position", Vector2(sprite.position), Vector2(100, -40), 1.5, ease_out_quad)
+
+
 Have fun using tweening!
 
 
@@ -140,17 +161,31 @@ http://www.robertpenner.com/easing/penner_chapter7_tweening.pdf
 """
 from __future__ import print_function, division
 
+import heapq
+import itertools
 import logging
 import random
+from array import array
 from math import asin
 from math import cos
 from math import isnan
 # noinspection PyPep8Naming
 from math import pi as PI
-from math import pow
 from math import sin
 from math import sqrt
 
+try:
+    from math import exp2
+except ImportError:
+    # math.exp2 is new in python 3.11
+    def exp2(x):
+        return 2.0 ** x
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # the vectorized ease functions are only available with numpy
+
 logger = logging.getLogger(__name__)
 logger.debug("importing...")
 
@@ -189,17 +224,22 @@ def ease_out_quad(t, b, c, d, p):  # pragma: nocover
 
 # noinspection PyUnusedLocal
 def ease_in_out_quad(t, b, c, d, p):  # pragma: nocover
-    t /= d / 2.0
+    t /= d * 0.5
     if t < 1:
-        return c / 2.0 * t * t + b
+        return c * 0.5 * t * t + b
     t -= 1
-    return -c / 2.0 * (t * (t - 2) - 1) + b
+    return -c * 0.5 * (t * (t - 2) - 1) + b
 
 
+# noinspection PyUnusedLocal
 def ease_out_in_quad(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_quad(t * 2, b, c / 2, d, p)
-    return ease_in_quad((t * 2) - d, b + c / 2, c / 2, d, p)
+    # ease_out_quad for the first half, ease_in_quad for the second half, each with half of the change, inlined
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d
+        return -c * t * (t - 2) + b
+    t = (t * 2 - d) / d
+    return c * t * t + (b + c)
 
 
 # noinspection PyUnusedLocal
@@ -216,18 +256,21 @@ def ease_out_cubic(t, b, c, d, p):  # pragma: nocover
 
 # noinspection PyUnusedLocal
 def ease_in_out_cubic(t, b, c, d, p):  # pragma: nocover
-    t /= d / 2
+    t /= d * 0.5
     if t < 1:
-        return c / 2 * t * t * t + b
+        return c * 0.5 * t * t * t + b
     t -= 2
-    return c / 2 * (t * t * t + 2) + b
+    return c * 0.5 * (t * t * t + 2) + b
 
 
 # noinspection PyUnusedLocal
 def ease_out_in_cubic(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_cubic(t * 2, b, c / 2, d, p)
-    return ease_in_cubic((t * 2) - d, b + c / 2, c / 2, d, p)
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d - 1
+        return c * (t * t * t + 1) + b
+    t = (t * 2 - d) / d
+    return c * t * t * t + (b + c)
 
 
 # noinspection PyUnusedLocal
@@ -244,17 +287,21 @@ def ease_out_quart(t, b, c, d, p):  # pragma: nocover
 
 # noinspection PyUnusedLocal
 def ease_in_out_quart(t, b, c, d, p):  # pragma: nocover
-    t /= d / 2
+    t /= d * 0.5
     if t < 1:
-        return c / 2 * t * t * t * t + b
+        return c * 0.5 * t * t * t * t + b
     t -= 2
-    return -c / 2 * (t * t * t * t - 2) + b
+    return -c * 0.5 * (t * t * t * t - 2) + b
 
 
+# noinspection PyUnusedLocal
 def ease_out_in_quart(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_quart(t * 2.0, b, c / 2, d, p)
-    return ease_in_quart((t * 2) - d, b + c / 2, c / 2, d, p)
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d - 1
+        return -c * (t * t * t * t - 1) + b
+    t = (t * 2 - d) / d
+    return c * t * t * t * t + (b + c)
 
 
 # noinspection PyUnusedLocal
@@ -271,203 +318,230 @@ def ease_out_quint(t, b, c, d, p):  # pragma: nocover
 
 # noinspection PyUnusedLocal
 def ease_in_out_quint(t, b, c, d, p):  # pragma: nocover
-    t /= d / 2
+    t /= d * 0.5
     if t < 1:
-        return c / 2 * t * t * t * t * t + b
+        return c * 0.5 * t * t * t * t * t + b
     t -= 2
-    return c / 2 * (t * t * t * t * t + 2) + b
+    return c * 0.5 * (t * t * t * t * t + 2) + b
 
 
 # noinspection PyUnusedLocal
 def ease_out_in_quint(t, b, c, d, p):  # pragma: nocover
-    c /= 2
-    if t < d / 2:
-        return ease_out_quint(t * 2, b, c, d, p)
-    return ease_in_quint(t * 2 - d, b + c, c, d, p)
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d - 1
+        return c * (t * t * t * t * t + 1) + b
+    t = (t * 2 - d) / d
+    return c * t * t * t * t * t + (b + c)
 
 
 # noinspection PyUnusedLocal
-def ease_in_sine(t, b, c, d, p):  # pragma: nocover
-    return -c * cos(t / d * HALF_PI) + c + b
+def ease_in_sine(t, b, c, d, p, _cos=cos, _HALF_PI=HALF_PI):  # pragma: nocover
+    return -c * _cos(t / d * _HALF_PI) + c + b
 
 
 # noinspection PyUnusedLocal
-def ease_in_sine2(t, b, c, d, p):  # pragma: nocover
-    return c * cos(t / d * TWO_PI) + b
+def ease_in_sine2(t, b, c, d, p, _cos=cos, _TWO_PI=TWO_PI):  # pragma: nocover
+    return c * _cos(t / d * _TWO_PI) + b
 
 
 # noinspection PyUnusedLocal
-def ease_in_sine3(t, b, c, d, p):  # pragma: nocover
-    return c * sin(t / d * TWO_PI) + b
+def ease_in_sine3(t, b, c, d, p, _sin=sin, _TWO_PI=TWO_PI):  # pragma: nocover
+    return c * _sin(t / d * _TWO_PI) + b
 
 
 # noinspection PyUnusedLocal
-def ease_out_sine(t, b, c, d, p):  # pragma: nocover
-    return c * sin(t / d * HALF_PI) + b
+def ease_out_sine(t, b, c, d, p, _sin=sin, _HALF_PI=HALF_PI):  # pragma: nocover
+    return c * _sin(t / d * _HALF_PI) + b
 
 
 # noinspection PyUnusedLocal
-def ease_in_out_sine(t, b, c, d, p):  # pragma: nocover
-    return -c / 2 * (cos(PI * t / d) - 1) + b
+def ease_in_out_sine(t, b, c, d, p, _cos=cos, _PI=PI):  # pragma: nocover
+    return -c * 0.5 * (_cos(_PI * t / d) - 1) + b
 
 
-def ease_out_in_sine(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_sine(t * 2, b, c / 2, d, p)
-    return ease_in_sine((t * 2) - d, b + c / 2, c / 2, d, p)
+# noinspection PyUnusedLocal
+def ease_out_in_sine(t, b, c, d, p, _cos=cos, _sin=sin, _HALF_PI=HALF_PI):  # pragma: nocover
+    c = c * 0.5
+    if t < d * 0.5:
+        return c * _sin(t * 2 / d * _HALF_PI) + b
+    return -c * _cos((t * 2 - d) / d * _HALF_PI) + c + (b + c)
 
 
 # noinspection PyUnusedLocal
-def ease_in_circ(t, b, c, d, p):  # pragma: nocover
+def ease_in_circ(t, b, c, d, p, _sqrt=sqrt):  # pragma: nocover
     t /= d + 0.0005
-    return -c * (sqrt(1 - t * t) - 1) + b
+    return -c * (_sqrt(1 - t * t) - 1) + b
 
 
 # noinspection PyUnusedLocal
-def ease_out_circ(t, b, c, d, p):  # pragma: nocover
+def ease_out_circ(t, b, c, d, p, _sqrt=sqrt):  # pragma: nocover
     t = t / d - 1
-    return c * sqrt(1 - t * t) + b
+    return c * _sqrt(1 - t * t) + b
 
 
 # noinspection PyUnusedLocal
-def ease_in_out_circ(t, b, c, d, p):  # pragma: nocover
-    t /= d / 2
+def ease_in_out_circ(t, b, c, d, p, _sqrt=sqrt):  # pragma: nocover
+    t /= d * 0.5
     if t < 1:
-        return -c / 2 * (sqrt(1 - t * t) - 1) + b
+        return -c * 0.5 * (_sqrt(1 - t * t) - 1) + b
     t -= 2
-    return c / 2 * (sqrt(1 - t * t) + 1) + b
+    return c * 0.5 * (_sqrt(1 - t * t) + 1) + b
 
 
 # noinspection PyUnusedLocal
-def ease_out_in_circ(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_circ(t * 2, b, c / 2, d, p)
-    return ease_in_circ(t * 2 - d, b + c / 2, c / 2, d, p)
+def ease_out_in_circ(t, b, c, d, p, _sqrt=sqrt):  # pragma: nocover
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d - 1
+        return c * _sqrt(1 - t * t) + b
+    t = (t * 2 - d) / (d + 0.0005)
+    return -c * (_sqrt(1 - t * t) - 1) + (b + c)
 
 
 # noinspection PyUnusedLocal
-def ease_in_expo(t, b, c, d, p):  # pragma: nocover
-    return b if t == 0 else c * (2 ** (10 * (t / d - 1))) + b - c * 0.001
+def ease_in_expo(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    return b if t == 0 else c * _exp2(10 * (t / d - 1)) + b - c * 0.001
 
 
 # noinspection PyUnusedLocal
-def ease_out_expo(t, b, c, d, p):  # pragma: nocover
-    return b + c if (t == d) else c * (-2 ** (-10 * t / d) + 1) + b
+def ease_out_expo(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    return b + c if (t == d) else c * (-_exp2(-10 * t / d) + 1) + b
 
 
 # noinspection PyUnusedLocal
-def ease_in_out_expo(t, b, c, d, p):  # pragma: nocover
+def ease_in_out_expo(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
     if t == 0:
         return b
     if t == d:
         return b + c
-    t /= d / 2
+    t /= d * 0.5
     if t < 1:
-        return c / 2 * pow(2, 10 * (t - 1)) + b - c * 0.0005
-    return c / 2 * 1.0005 * (-pow(2, -10 * (t - 1)) + 2) + b
+        return c * 0.5 * _exp2(10 * (t - 1)) + b - c * 0.0005
+    return c * 0.5 * 1.0005 * (-_exp2(-10 * (t - 1)) + 2) + b
 
 
 # noinspection PyUnusedLocal
-def ease_out_in_expo(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_expo(t * 2, b, c / 2, d, p)
-    return ease_in_expo((t * 2) - d, b + c / 2, c / 2, d, p)
+def ease_out_in_expo(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    c = c * 0.5
+    if t < d * 0.5:
+        t *= 2
+        return b + c if (t == d) else c * (-_exp2(-10 * t / d) + 1) + b
+    t = t * 2 - d
+    b = b + c
+    return b if t == 0 else c * _exp2(10 * (t / d - 1)) + b - c * 0.001
 
 
 # noinspection PyUnusedLocal
-def ease_in_elastic(t, b, c, d, params):  # pragma: nocover
+def ease_in_elastic(t, b, c, d, params, _sin=sin, _exp2=exp2, _asin=asin, _TWO_PI=TWO_PI):  # pragma: nocover
     if t == 0:
         return b
     t /= d
     if t == 1:
         return b + c
-    p = d * 0.3 if params is None or isnan(params.period) else params.period
-    a = 0 if params is None or isnan(params.amplitude) else params.amplitude
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
     if a == 0 or a < abs(c):
         a = c
         s = p / 4
     else:
-        s = p / TWO_PI * asin(c / a)
+        s = p / _TWO_PI * _asin(c / a)
     t -= 1
-    return -(a * pow(2, 10 * t) * sin((t * d - s) * TWO_PI / p)) + b
+    return -(a * _exp2(10 * t) * _sin((t * d - s) * _TWO_PI / p)) + b
 
 
 # noinspection PyUnusedLocal
-def ease_out_elastic(t, b, c, d, params):  # pragma: nocover
+def ease_out_elastic(t, b, c, d, params, _sin=sin, _exp2=exp2, _asin=asin, _TWO_PI=TWO_PI):  # pragma: nocover
     if t == 0:
         return b
     t /= d
     if t == 1:
         return b + c
-    p = d * 0.3 if params is None or isnan(params.period) else params.period
-    a = 1.0 if params is None or isnan(params.amplitude) else params.amplitude
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 1.0 if params is None or params.amplitude is None else params.amplitude
     if a == 0 or a < abs(c):
         a = c
         s = p / 4
     else:
-        s = p / TWO_PI * asin(c / a)
+        s = p / _TWO_PI * _asin(c / a)
 
-    return a * pow(2, -10 * t) * sin((t * d - s) * TWO_PI / p) + c + b
+    return a * _exp2(-10 * t) * _sin((t * d - s) * _TWO_PI / p) + c + b
 
 
-def ease_in_out_elastic(t, b, c, d, params):  # pragma: nocover
+def ease_in_out_elastic(t, b, c, d, params, _sin=sin, _exp2=exp2, _asin=asin, _TWO_PI=TWO_PI):  # pragma: nocover
     if t == 0:
         return b
-    t /= d / 2
+    t /= d * 0.5
     if t == 2:
         return b + c
-    p = d * 0.3 * 1.5 if params is None or isnan(params.period) else params.period
-    a = 0 if params is None or isnan(params.amplitude) else params.amplitude
+    p = d * 0.3 * 1.5 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
     if a == 0 or a < abs(c):
         a = c
         s = p / 4
     else:
-        s = p / TWO_PI * asin(c / a)
+        s = p / _TWO_PI * _asin(c / a)
     if t < 1:
         t -= 1
-        return -0.5 * (a * pow(2, 10 * t) * sin((t * d - s) * TWO_PI / p)) + b
+        return -0.5 * (a * _exp2(10 * t) * _sin((t * d - s) * _TWO_PI / p)) + b
     t -= 1
-    return a * pow(2, -10 * t) * sin((t * d - s) * TWO_PI / p) * 0.5 + c + b
+    return a * _exp2(-10 * t) * _sin((t * d - s) * _TWO_PI / p) * 0.5 + c + b
 
 
 def ease_out_in_elastic(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_elastic(t * 2, b, c / 2, d, p)
-    return ease_in_elastic((t * 2) - d, b + c / 2, c / 2, d, p)
+    if t < d * 0.5:
+        return ease_out_elastic(t * 2, b, c * 0.5, d, p)
+    return ease_in_elastic((t * 2) - d, b + c * 0.5, c * 0.5, d, p)
 
 
 def ease_in_back(t, b, c, d, p):  # pragma: nocover
-    s = 1.70158 if p is None or isnan(p.overshoot) else p.overshoot
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
     t /= d
     return c * t * t * ((s + 1) * t - s) + b
 
 
 def ease_out_back(t, b, c, d, p):  # pragma: nocover
-    s = 1.70158 if p is None or isnan(p.overshoot) else p.overshoot
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
     t = t / d - 1
     return c * (t * t * ((s + 1) * t + s) + 1) + b
 
 
 def ease_in_out_back(t, b, c, d, p):  # pragma: nocover
-    s = 1.70158 if p is None or isnan(p.overshoot) else p.overshoot
-    t /= d / 2
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
+    t /= d * 0.5
     if t < 1:
         s *= 1.525
-        return c / 2 * (t * t * ((s + 1) * t - s)) + b
+        return c * 0.5 * (t * t * ((s + 1) * t - s)) + b
     s *= 1.525
     t -= 2
-    return c / 2 * (t * t * ((s + 1) * t + s) + 2) + b
+    return c * 0.5 * (t * t * ((s + 1) * t + s) + 2) + b
 
 
 def ease_out_in_back(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_back(t * 2, b, c / 2, d, p)
-    return ease_in_back((t * 2) - d, b + c / 2, c / 2, d, p)
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
+    c = c * 0.5
+    if t < d * 0.5:
+        t = t * 2 / d - 1
+        return c * (t * t * ((s + 1) * t + s) + 1) + b
+    t = (t * 2 - d) / d
+    return c * t * t * ((s + 1) * t - s) + (b + c)
 
 
 # noinspection PyUnusedLocal
 def ease_in_bounce(t, b, c, d, p=None):  # pragma: nocover
-    return c - ease_out_bounce(d - t, 0, c, d) + b
+    # c - ease_out_bounce(d - t, 0, c, d) + b inlined, saves a call per update
+    t = (d - t) / d
+    if t < (1 / 2.75):
+        return c - c * (7.5625 * t * t) + b
+    elif t < (2 / 2.75):
+        t -= (1.5 / 2.75)
+        return c - c * (7.5625 * t * t + 0.75) + b
+    elif t < (2.5 / 2.75):
+        t -= (2.25 / 2.75)
+        return c - c * (7.5625 * t * t + 0.9375) + b
+    else:
+        t -= (2.625 / 2.75)
+        return c - c * (7.5625 * t * t + 0.984375) + b
 
 
 # noinspection PyUnusedLocal
@@ -488,19 +562,19 @@ def ease_out_bounce(t, b, c, d, p=None):  # pragma: nocover
 
 # noinspection PyUnusedLocal
 def ease_in_out_bounce(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
+    if t < d * 0.5:
         return ease_in_bounce(t * 2, 0, c, d) * 0.5 + b
     else:
         return ease_out_bounce(t * 2 - d, 0, c, d) * 0.5 + c * 0.5 + b
 
 
 def ease_out_in_bounce(t, b, c, d, p):  # pragma: nocover
-    if t < d / 2:
-        return ease_out_bounce(t * 2, b, c / 2, d, p)
-    return ease_in_bounce((t * 2) - d, b + c / 2, c / 2, d, p)
+    if t < d * 0.5:
+        return ease_out_bounce(t * 2, b, c * 0.5, d, p)
+    return ease_in_bounce((t * 2) - d, b + c * 0.5, c * 0.5, d, p)
 
 
-def ease_random_int_bounce(t, b, c, d, p=(0, 1)):  # pragma: nocover
+def ease_random_int_bounce(t, b, c, d, p=(0, 1), _randrange=random.randrange):  # pragma: nocover
     """
     Random bouncing in range provided in p.
 
@@ -514,25 +588,430 @@ def ease_random_int_bounce(t, b, c, d, p=(0, 1)):  # pragma: nocover
     if t < d:
         if t == 0:
             return b
-        p = (0, 1) if p is None else p
-        return b + random.randint(*p)
+        low, high = (0, 1) if p is None else p
+        return b + _randrange(low, high + 1)  # same as random.randint(low, high) without its extra call
     else:
         return b + c
 
 
+# specialized elastic and back ease functions used by the tweener, the last argument is not a Parameters instance but
+# the values precomputed once per tween (start) by the matching *_params function, see _Tween._precompute_ease_params
+
+def _elastic_amplitude_and_shift(p, a, c):  # pragma: nocover
+    if a == 0 or a < abs(c):
+        return p, c, p / 4
+    return p, a, p / TWO_PI * asin(c / a)
+
+
+def _ease_in_elastic_params(c, d, params):  # pragma: nocover
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
+    return _elastic_amplitude_and_shift(p, a, c)
+
+
+def _ease_out_elastic_params(c, d, params):  # pragma: nocover
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 1.0 if params is None or params.amplitude is None else params.amplitude
+    return _elastic_amplitude_and_shift(p, a, c)
+
+
+def _ease_in_out_elastic_params(c, d, params):  # pragma: nocover
+    p = d * 0.3 * 1.5 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
+    return _elastic_amplitude_and_shift(p, a, c)
+
+
+def ease_in_elastic_fast(t, b, c, d, precomputed, _sin=sin, _exp2=exp2, _TWO_PI=TWO_PI):  # pragma: nocover
+    if t == 0:
+        return b
+    t /= d
+    if t == 1:
+        return b + c
+    p, a, s = precomputed
+    t -= 1
+    return -(a * _exp2(10 * t) * _sin((t * d - s) * _TWO_PI / p)) + b
+
+
+def ease_out_elastic_fast(t, b, c, d, precomputed, _sin=sin, _exp2=exp2, _TWO_PI=TWO_PI):  # pragma: nocover
+    if t == 0:
+        return b
+    t /= d
+    if t == 1:
+        return b + c
+    p, a, s = precomputed
+    return a * _exp2(-10 * t) * _sin((t * d - s) * _TWO_PI / p) + c + b
+
+
+def ease_in_out_elastic_fast(t, b, c, d, precomputed, _sin=sin, _exp2=exp2, _TWO_PI=TWO_PI):  # pragma: nocover
+    if t == 0:
+        return b
+    t /= d * 0.5
+    if t == 2:
+        return b + c
+    p, a, s = precomputed
+    if t < 1:
+        t -= 1
+        return -0.5 * (a * _exp2(10 * t) * _sin((t * d - s) * _TWO_PI / p)) + b
+    t -= 1
+    return a * _exp2(-10 * t) * _sin((t * d - s) * _TWO_PI / p) * 0.5 + c + b
+
+
+# noinspection PyUnusedLocal
+def _ease_back_params(c, d, params):  # pragma: nocover
+    return 1.70158 if params is None or params.overshoot is None else params.overshoot
+
+
+# noinspection PyUnusedLocal
+def _ease_in_out_back_params(c, d, params):  # pragma: nocover
+    return (1.70158 if params is None or params.overshoot is None else params.overshoot) * 1.525
+
+
+def ease_in_back_fast(t, b, c, d, s):  # pragma: nocover
+    t /= d
+    return c * t * t * ((s + 1) * t - s) + b
+
+
+def ease_out_back_fast(t, b, c, d, s):  # pragma: nocover
+    t = t / d - 1
+    return c * (t * t * ((s + 1) * t + s) + 1) + b
+
+
+def ease_in_out_back_fast(t, b, c, d, s):  # pragma: nocover
+    t /= d * 0.5
+    if t < 1:
+        return c * 0.5 * (t * t * ((s + 1) * t - s)) + b
+    t -= 2
+    return c * 0.5 * (t * t * ((s + 1) * t + s) + 2) + b
+
+
+# specialized expo ease functions used by the tweener, without the t == 0 and t == d checks: the tweener evaluates the
+# last step of a tween with the original ease function (t == 0 is only hit when a delay ends exactly on an update, then
+# these return the limit of the curve, which is off from b by less than 0.00003 * c)
+
+# noinspection PyUnusedLocal
+def _ease_expo_params(c, d, params):  # pragma: nocover
+    return params
+
+
+# noinspection PyUnusedLocal
+def ease_in_expo_fast(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    return c * _exp2(10 * (t / d - 1)) + b - c * 0.001
+
+
+# noinspection PyUnusedLocal
+def ease_out_expo_fast(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    return c * (-_exp2(-10 * t / d) + 1) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_expo_fast(t, b, c, d, p, _exp2=exp2):  # pragma: nocover
+    t /= d * 0.5
+    if t < 1:
+        return c * 0.5 * _exp2(10 * (t - 1)) + b - c * 0.0005
+    return c * 0.5 * 1.0005 * (-_exp2(-10 * (t - 1)) + 2) + b
+
+
+# vectorized ease functions, these mirror the ease functions above but accept numpy arrays for t, b, c and d (numpy is
+# optional, these are only usable if it is installed, see vectorized_ease_functions)
+
+#  noinspection PyUnusedLocal
+def ease_linear_vec(t, b, c, d, p):  # pragma: nocover
+    return c * t / d + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_quad_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d
+    return c * t * t + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_quad_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d
+    return -c * t * (t - 2) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_quad_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d * 0.5)
+    t2 = t - 1
+    return np.where(t < 1, c * 0.5 * t * t + b, -c * 0.5 * (t2 * (t2 - 2) - 1) + b)
+
+
+def _ease_out_in_vec(ease_out, ease_in, t, b, c, d, p):  # pragma: nocover
+    # both halves are evaluated for all elements, the ones out of their range are discarded by where
+    with np.errstate(invalid='ignore'):
+        return np.where(t < d * 0.5, ease_out(t * 2, b, c * 0.5, d, p), ease_in(t * 2 - d, b + c * 0.5, c * 0.5, d, p))
+
+
+def ease_out_in_quad_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_quad_vec, ease_in_quad_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_cubic_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d
+    return c * t * t * t + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_cubic_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d - 1
+    return c * (t * t * t + 1) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_cubic_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d * 0.5)
+    t2 = t - 2
+    return np.where(t < 1, c * 0.5 * t * t * t + b, c * 0.5 * (t2 * t2 * t2 + 2) + b)
+
+
+def ease_out_in_cubic_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_cubic_vec, ease_in_cubic_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_quart_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d
+    return c * t * t * t * t + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_quart_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d - 1
+    return -c * (t * t * t * t - 1) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_quart_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d * 0.5)
+    t2 = t - 2
+    return np.where(t < 1, c * 0.5 * t * t * t * t + b, -c * 0.5 * (t2 * t2 * t2 * t2 - 2) + b)
+
+
+def ease_out_in_quart_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_quart_vec, ease_in_quart_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_quint_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d
+    return c * t * t * t * t * t + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_quint_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d - 1
+    return c * (t * t * t * t * t + 1) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_quint_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d * 0.5)
+    t2 = t - 2
+    return np.where(t < 1, c * 0.5 * t * t * t * t * t + b, c * 0.5 * (t2 * t2 * t2 * t2 * t2 + 2) + b)
+
+
+def ease_out_in_quint_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_quint_vec, ease_in_quint_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_sine_vec(t, b, c, d, p):  # pragma: nocover
+    return -c * np.cos(t / d * HALF_PI) + c + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_sine2_vec(t, b, c, d, p):  # pragma: nocover
+    return c * np.cos(t / d * TWO_PI) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_sine3_vec(t, b, c, d, p):  # pragma: nocover
+    return c * np.sin(t / d * TWO_PI) + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_sine_vec(t, b, c, d, p):  # pragma: nocover
+    return c * np.sin(t / d * HALF_PI) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_sine_vec(t, b, c, d, p):  # pragma: nocover
+    return -c * 0.5 * (np.cos(PI * t / d) - 1) + b
+
+
+def ease_out_in_sine_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_sine_vec, ease_in_sine_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_circ_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d + 0.0005)
+    return -c * (np.sqrt(1 - t * t) - 1) + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_circ_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / d - 1
+    return c * np.sqrt(1 - t * t) + b
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_circ_vec(t, b, c, d, p):  # pragma: nocover
+    t = t / (d * 0.5)
+    t2 = t - 2
+    with np.errstate(invalid='ignore'):
+        return np.where(t < 1, -c * 0.5 * (np.sqrt(1 - t * t) - 1) + b, c * 0.5 * (np.sqrt(1 - t2 * t2) + 1) + b)
+
+
+def ease_out_in_circ_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_circ_vec, ease_in_circ_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_expo_vec(t, b, c, d, p):  # pragma: nocover
+    return np.where(t == 0, b, c * np.exp2(10 * (t / d - 1)) + b - c * 0.001)
+
+
+# noinspection PyUnusedLocal
+def ease_out_expo_vec(t, b, c, d, p):  # pragma: nocover
+    return np.where(t == d, b + c, c * (-np.exp2(-10 * t / d) + 1) + b)
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_expo_vec(t, b, c, d, p):  # pragma: nocover
+    u = t / (d * 0.5)
+    value = np.where(u < 1, c * 0.5 * np.exp2(10 * (u - 1)) + b - c * 0.0005,
+                     c * 0.5 * 1.0005 * (-np.exp2(-10 * (u - 1)) + 2) + b)
+    return np.where(t == 0, b, np.where(t == d, b + c, value))
+
+
+def ease_out_in_expo_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_expo_vec, ease_in_expo_vec, t, b, c, d, p)
+
+
+def _elastic_amplitude_and_shift_vec(a, c, p):  # pragma: nocover
+    # elementwise version of the amplitude/shift branch of the scalar elastic ease functions
+    a = np.asarray(a, dtype=float)  # as arrays, so scalars divide by zero like arrays instead of raising
+    c = np.asarray(c, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        use_c = (a == 0) | (a < np.abs(c))
+        s = np.where(use_c, p / 4, p / TWO_PI * np.arcsin(c / a))
+    return np.where(use_c, c, a), s
+
+
+def ease_in_elastic_vec(t, b, c, d, params):  # pragma: nocover
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
+    a, s = _elastic_amplitude_and_shift_vec(a, c, p)
+    u = t / d
+    u1 = u - 1
+    value = -(a * np.exp2(10 * u1) * np.sin((u1 * d - s) * TWO_PI / p)) + b
+    return np.where(t == 0, b, np.where(u == 1, b + c, value))
+
+
+def ease_out_elastic_vec(t, b, c, d, params):  # pragma: nocover
+    p = d * 0.3 if params is None or params.period is None else params.period
+    a = 1.0 if params is None or params.amplitude is None else params.amplitude
+    a, s = _elastic_amplitude_and_shift_vec(a, c, p)
+    u = t / d
+    value = a * np.exp2(-10 * u) * np.sin((u * d - s) * TWO_PI / p) + c + b
+    return np.where(t == 0, b, np.where(u == 1, b + c, value))
+
+
+def ease_in_out_elastic_vec(t, b, c, d, params):  # pragma: nocover
+    p = d * 0.3 * 1.5 if params is None or params.period is None else params.period
+    a = 0 if params is None or params.amplitude is None else params.amplitude
+    a, s = _elastic_amplitude_and_shift_vec(a, c, p)
+    u = t / (d * 0.5)
+    u1 = u - 1
+    wave = np.sin((u1 * d - s) * TWO_PI / p)
+    value = np.where(u < 1, -0.5 * (a * np.exp2(10 * u1) * wave) + b, a * np.exp2(-10 * u1) * wave * 0.5 + c + b)
+    return np.where(t == 0, b, np.where(u == 2, b + c, value))
+
+
+def ease_out_in_elastic_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_elastic_vec, ease_in_elastic_vec, t, b, c, d, p)
+
+
+def ease_in_back_vec(t, b, c, d, p):  # pragma: nocover
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
+    t = t / d
+    return c * t * t * ((s + 1) * t - s) + b
+
+
+def ease_out_back_vec(t, b, c, d, p):  # pragma: nocover
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
+    t = t / d - 1
+    return c * (t * t * ((s + 1) * t + s) + 1) + b
+
+
+def ease_in_out_back_vec(t, b, c, d, p):  # pragma: nocover
+    s = 1.70158 if p is None or p.overshoot is None else p.overshoot
+    s *= 1.525
+    t = t / (d * 0.5)
+    t2 = t - 2
+    return np.where(t < 1, c * 0.5 * (t * t * ((s + 1) * t - s)) + b, c * 0.5 * (t2 * t2 * ((s + 1) * t2 + s) + 2) + b)
+
+
+def ease_out_in_back_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_back_vec, ease_in_back_vec, t, b, c, d, p)
+
+
+# noinspection PyUnusedLocal
+def ease_in_bounce_vec(t, b, c, d, p=None):  # pragma: nocover
+    return c - ease_out_bounce_vec(d - t, 0, c, d) + b
+
+
+# noinspection PyUnusedLocal
+def ease_out_bounce_vec(t, b, c, d, p=None):  # pragma: nocover
+    t = t / d
+    t1 = t - (1.5 / 2.75)
+    t2 = t - (2.25 / 2.75)
+    t3 = t - (2.625 / 2.75)
+    return np.select([t < (1 / 2.75), t < (2 / 2.75), t < (2.5 / 2.75)],
+                     [c * (7.5625 * t * t) + b,
+                      c * (7.5625 * t1 * t1 + 0.75) + b,
+                      c * (7.5625 * t2 * t2 + 0.9375) + b],
+                     c * (7.5625 * t3 * t3 + 0.984375) + b)
+
+
+# noinspection PyUnusedLocal
+def ease_in_out_bounce_vec(t, b, c, d, p):  # pragma: nocover
+    return np.where(t < d * 0.5, ease_in_bounce_vec(t * 2, 0, c, d) * 0.5 + b,
+                    ease_out_bounce_vec(t * 2 - d, 0, c, d) * 0.5 + c * 0.5 + b)
+
+
+def ease_out_in_bounce_vec(t, b, c, d, p):  # pragma: nocover
+    return _ease_out_in_vec(ease_out_bounce_vec, ease_in_bounce_vec, t, b, c, d, p)
+
+
 class Parameters(object):
     """
     The parameters for the ease functions.
 
-    :param period: default is nan, the period of the function
-    :param amplitude: default is nan, the amplitude of the function
-    :param overshoot: default is nan, the overshoot of the function
+    :param period: default is None, the period of the function
+    :param amplitude: default is None, the amplitude of the function
+    :param overshoot: default is None, the overshoot of the function
+
+    Unset values are None (nan is accepted too) and the ease functions use their default instead.
     """
 
-    def __init__(self, period=float("nan"), amplitude=float("nan"), overshoot=float("nan")):
-        self.period = float(period)
-        self.amplitude = float(amplitude)
-        self.overshoot = float(overshoot)
+    __slots__ = ('period', 'amplitude', 'overshoot')
+
+    def __init__(self, period=None, amplitude=None, overshoot=None):
+        self.period = self._to_float_or_none(period)
+        self.amplitude = self._to_float_or_none(amplitude)
+        self.overshoot = self._to_float_or_none(overshoot)
+
+    @staticmethod
+    def _to_float_or_none(value):
+        if value is None:
+            return None
+        value = float(value)
+        return None if isnan(value) else value
 
 
 class TweenStates(object):
@@ -597,13 +1076,15 @@ class _Parallel(object):
         parallel_group.start()
     """
 
+    __slots__ = ('_remaining', 'tweener', '_tweens', 'state', 'cb', 'cb_args', 't', '_current_tween_cb', '_saved_cb')
+
     def __init__(self, tweener, *tweens):
         """
         Parallel group execution control constructor.
         :param tweener: The tweener instance to use. Has to be the same in all instances.
         :param tweens: The tweens or groups to execute in parallel.
         """
-        self._tween_callbacks = {}
+        self._remaining = 0  # count of the tweens that have not ended yet
         self.tweener = tweener
         self._tweens = list(tweens)
         self.state = tweener.TweenStates.created
@@ -612,7 +1093,7 @@ class _Parallel(object):
         self.cb_args = tuple()
         self.t = 0
         self._current_tween_cb = None
-        self.__max_dur_tween = None
+        self._saved_cb = None  # used by the parallel group containing this one
 
     def _validate_tweens_state_and_same_tweener(self):
         for t in self._tweens:
@@ -629,7 +1110,7 @@ class _Parallel(object):
     @property
     def d(self):
         """Returns the duration of the longest tween (which defines the duration of the group)."""
-        return list(sorted(self._tweens, key=lambda t: t.d))[-1].d
+        return max(_t.d for _t in self._tweens)
 
     def next(self, *other):
         """
@@ -679,22 +1160,28 @@ class _Parallel(object):
         :param immediate: if true, calculates the first value of the tweens when start is called, defaults to False
         """
         self.t = 0
-        self._tween_callbacks.clear()
+        self._remaining = len(self._tweens)
+        own_cb = self.call_back_to_parallel
         for _t in self._tweens:
             _t.start(immediate=immediate)
-            self._tween_callbacks[_t] = _t.cb
-            _t.cb = self.call_back_to_parallel
+            if _t.cb != own_cb:  # restarted while running, the own callback of the tween is saved already
+                _t._saved_cb = _t.cb
+                _t.cb = own_cb
 
         self.state = TweenStates.active
 
     def stop(self):
         """Stop all tween execution of all contained tweens."""
         self.state = TweenStates.ended
+        self._remaining = 0
+        own_cb = self.call_back_to_parallel
+        ended = TweenStates.ended
         for _t in self._tweens:
-            _t.stop()
-            if _t in self._tween_callbacks:
-                _t.cb = self._tween_callbacks[_t]
-        self._tween_callbacks.clear()
+            if _t.state != ended:  # ended ones are not registered in the tweener anymore
+                _t.stop()
+            if _t.cb == own_cb:
+                _t.cb = _t._saved_cb
+                _t._saved_cb = None
 
     def call_back_to_parallel(self, *args):
         """
@@ -706,12 +1193,15 @@ class _Parallel(object):
 
         self.t = ended_tween.t  # this is automatically the longest running tween time (because called last)
 
-        ended_tween.cb = self._tween_callbacks.pop(ended_tween, None)
-        if ended_tween.cb is not None:
-            ended_tween.cb(*(list(ended_tween.cb_args) + [ended_tween]))
+        if ended_tween.cb == self.call_back_to_parallel:  # only count the first end of a tween per start
+            ended_tween.cb = ended_tween._saved_cb
+            ended_tween._saved_cb = None
+            self._remaining -= 1
+            if ended_tween.cb is not None:
+                ended_tween.cb(*ended_tween.cb_args, ended_tween)
 
-        if self.cb and len(self._tween_callbacks) == 0:
-            self.cb(*(list(self.cb_args) + [self]))
+        if self.cb and self._remaining == 0:
+            self.cb(*self.cb_args, self)
 
 
 class _Serial(object):
@@ -728,6 +1218,9 @@ class _Serial(object):
         serial_group.start()
     """
 
+    __slots__ = ('_tweens', 'tweener', 'state', 'cb', 'cb_args', '_current_tween_index', 'immediate',
+                 '_current_tween_cb', 't', 'is_looping', '_saved_cb')
+
     def __init__(self, tweener, *tweens):
         """
         Serial group execution control constructor.
@@ -745,6 +1238,7 @@ class _Serial(object):
         self._current_tween_cb = None
         self.t = 0
         self.is_looping = False
+        self._saved_cb = None  # used by the parallel group containing this one
 
     def _validate_tweens_state_and_same_tweener(self):
         for t in self._tweens:
@@ -819,8 +1313,10 @@ class _Serial(object):
 
     def stop(self):
         """Stop all tween execution of all contained tweens."""
+        ended = TweenStates.ended
         for _t in self._tweens:
-            _t.stop()
+            if _t.state != ended:  # ended ones are not registered in the tweener anymore
+                _t.stop()
         if self.state == TweenStates.active:
             _current_tween = self._tweens[self._current_tween_index]
             _current_tween.cb = self._current_tween_cb
@@ -833,7 +1329,7 @@ class _Serial(object):
             while _tween.d <= over_time:
                 # call cb of tween
                 if _tween.cb:
-                    _tween.cb(*(list(_tween.cb_args) + [_tween]))
+                    _tween.cb(*_tween.cb_args, _tween)
 
                 # update attr of object
                 setattr(_tween.o, _tween.a, _tween.f(_tween.d, _tween.b, _tween.c, _tween.d, _tween.p))
@@ -843,7 +1339,8 @@ class _Serial(object):
                 _tween = self._get_next_tween()
                 if _tween is None:
                     # no tween left in series
-                    self._call_own_callback()
+                    if self.cb:
+                        self.cb(*self.cb_args, self)
                     return
                 else:
                     self._current_tween_index += 1
@@ -851,16 +1348,13 @@ class _Serial(object):
             self._current_tween_cb = _tween.cb
             _tween.cb = self.call_back_to_serial
             _tween.start(immediate=self.immediate)
-            _tween.t += over_time  # set start time of tween to the actual time
+            self.tweener._shift_tween_time(_tween, over_time)  # set start time of tween to the actual time
         else:
             if self.is_looping:
                 self._current_tween_index = -1
                 self._start_tween(over_time)
-            self._call_own_callback()
-
-    def _call_own_callback(self):
-        if self.cb:
-            self.cb(*(list(self.cb_args) + [self]))
+            if self.cb:
+                self.cb(*self.cb_args, self)
 
     def _get_next_tween(self):
         _next_tween_idx = self._current_tween_index + 1
@@ -879,11 +1373,15 @@ class _Serial(object):
         self.t += ended_tween.t
         ended_tween.cb = self._current_tween_cb
         if ended_tween.cb:
-            ended_tween.cb(*(list(ended_tween.cb_args) + [ended_tween]))
+            ended_tween.cb(*ended_tween.cb_args, ended_tween)
         self._start_tween(over_time)
 
 
 class _Tween(object):
+    # the attributes read by Tweener.update each frame first, so they share the first cache lines of the instance
+    __slots__ = ('_t', 'd', '_ease', 'b', 'c', '_ease_params', 'delta_update', 'o', 'a', 'v',
+                 'state', 'f', 'p', 'cb', 'cb_args', 'tweener', 'delay', 'ease_id', '_saved_cb', '_delay_entry')
+
     States = TweenStates
 
     def __init__(self, tweener, obj, attr_name, begin, change, duration, ease_function, params, delay, delta_update,
@@ -898,19 +1396,58 @@ class _Tween(object):
 
         # tween variables
         self.delay = delay
-        self.t = float(-delay)
+        self._t = -delay if type(delay) is float else float(-delay)  # see t
         self.f = ease_function
 
-        # tween parameters
-        self.b = begin * 1.0  # convert to float
-        self.c = change * 1.0  # convert to float
-        self.d = float(duration)
+        # tween parameters, floats are taken as they are
+        self.b = begin if type(begin) is float else begin * 1.0  # convert to float (or copy a vector)
+        self.c = change if type(change) is float else change * 1.0  # convert to float (or copy a vector)
+        self.d = duration if type(duration) is float else float(duration)
         self.p = params
 
+        # ease function and parameters actually used by the tweener, see _precompute_ease_params
+        self.ease_id = EASE_IDS.get(ease_function, -1)
+        self._ease = ease_function
+        self._ease_params = params
+
         # delta update
         self.v = self.b
         self.delta_update = delta_update
 
+        self._saved_cb = None  # used by the parallel group containing this tween
+        self._delay_entry = None  # the entry in the tweener's delay queue while waiting for the delay to elapse
+
+    def _precompute_ease_params(self):
+        # the parameters of some ease functions only depend on c, d and p, compute them once instead of each update
+        self.ease_id = EASE_IDS.get(self.f, -1)
+        fast = _fast_ease_functions.get(self.f, None)
+        if fast is None:
+            self._ease = self.f
+            self._ease_params = self.p
+        else:
+            self._ease = fast[0]
+            self._ease_params = fast[1](self.c, self.d, self.p)
+
+    @property
+    def t(self):
+        """The current time of the tween, negative while waiting for the delay to elapse."""
+        entry = self._delay_entry
+        if entry is None:
+            return self._t
+        return self.tweener._clock - entry[0]  # waiting in the delay queue, where the time is not updated
+
+    @t.setter
+    def t(self, value):
+        # the tweener keeps the tweens with a negative time in its delay queue, so move the tween if needed
+        tweener = self.tweener
+        was_delayed = tweener._take_delayed(self)
+        self._t = value
+        if was_delayed:
+            tweener._activate(self)
+        elif value < 0.0 and self in tweener._active_tweens:
+            del tweener._active_tweens[self]
+            tweener._activate(self)
+
     def pause(self):
         self.tweener.pause_tween(self)
 
@@ -967,8 +1504,16 @@ class Tweener(object):
         :param logger_instance: if set to None, then the default logger is used, if set to False no logging is done at
             all and if an instance is provided, then this one is used.
         """
-        self._active_tweens = []  # ? maybe a dict? {entity: [tween]}
-        self._paused_tweens = []
+        # insertion ordered dicts {tween: None} used as ordered sets for O(1) membership and removal
+        self._active_tweens = {}
+        self._paused_tweens = {}
+        # active tweens still waiting for their delay are not updated, they wait in a heap of
+        # [start time, sequence number, tween] entries (tween set to None when removed) until self._clock reaches it
+        self._delayed_tweens = []
+        self._delay_sequence = itertools.count()
+        self._clock = 0.0
+        self._tweens_by_obj = {}  # {id(obj): {tween: None}} all registered tweens per object for get_all_tweens_for
+        self._ended_tweens = []  # reused by update as long as no tween ends
         self._logger = logger if logger_instance is None else (None if logger_instance is False else logger_instance)
 
     def update(self, delta_time):
@@ -976,33 +1521,87 @@ class Tweener(object):
         The update method. It updates the tweens and calculates the new values of the tweens based on the time that
         has passed.
 
+        The end callbacks are called after all tweens have been updated and the ended ones removed, so they can
+        start, stop or create any tweens. Tweens started by a callback are updated from the next update on (an
+        immediate tween gets its begin value right away). A tween whose delay elapses is moved behind the tweens
+        already running. So its value is set last (it wins over them on the same attribute) and its end callback is
+        called after theirs in the same update.
+
         :param delta_time: The time difference since last update.
         """
-        ended_tweens = []
-        for tween in self._active_tweens:
-            tween.t += delta_time
-            if tween.t >= 0.0:
-                _cur_time = tween.t
-                if tween.t >= tween.d:
-                    ended_tweens.append(tween)
-                    _cur_time = tween.d
-                value = tween.f(_cur_time, tween.b, tween.c, tween.d, tween.p)
-                if tween.delta_update:
-                    delta = value - tween.v
-                    tween.v = value
-                    attr_value = getattr(tween.o, tween.a)
-                    setattr(tween.o, tween.a, attr_value + delta)
+        active_tweens = self._active_tweens
+        delayed = self._delayed_tweens
+        if delta_time <= 0.0 or not (active_tweens or delayed):
+            return  # nothing would change
+
+        ended_tweens = self._ended_tweens
+        _setattr = setattr
+        _getattr = getattr
+        _ease_linear = ease_linear
+        _ease_in_quad = ease_in_quad
+        _ease_in_out_quad = ease_in_out_quad
+        ended_state = self.TweenStates.ended
+
+        self._clock = clock = self._clock + delta_time
+        _heappop = heapq.heappop
+        while delayed and delayed[0][0] <= clock:
+            start_time, _, tween = _heappop(delayed)
+            if tween is not None:
+                tween._delay_entry = None
+                tween._t = clock - start_time - delta_time  # the delta is added in the loop below
+                active_tweens[tween] = None
+
+        for tween in active_tweens:
+            _cur_time = tween._t + delta_time
+            tween._t = _cur_time
+            # tweens waiting for their delay are in the delay queue, so the time of active tweens is never negative
+            d = tween.d
+            if _cur_time >= d:
+                ended_tweens.append(tween)
+                tween.state = ended_state
+                # last step with the original ease function, the specialized ones may skip the end checks
+                value = tween.f(d, tween.b, tween.c, d, tween.p)
+            else:
+                ease = tween._ease
+                # the ease functions used most (linear is the default) are computed inline to save the call
+                if ease is _ease_linear:
+                    value = tween.c * _cur_time / d + tween.b
+                elif ease is _ease_in_quad:
+                    _cur_time /= d
+                    value = tween.c * _cur_time * _cur_time + tween.b
+                elif ease is _ease_in_out_quad:
+                    _cur_time /= d * 0.5
+                    if _cur_time < 1:
+                        value = tween.c * 0.5 * _cur_time * _cur_time + tween.b
+                    else:
+                        _cur_time -= 1
+                        value = -tween.c * 0.5 * (_cur_time * (_cur_time - 2) - 1) + tween.b
                 else:
-                    setattr(tween.o, tween.a, value)
+                    value = ease(_cur_time, tween.b, tween.c, d, tween._ease_params)
+            if tween.delta_update:
+                delta = value - tween.v
+                tween.v = value
+                obj = tween.o
+                attr_name = tween.a
+                _setattr(obj, attr_name, _getattr(obj, attr_name) + delta)
+            else:
+                # the builtin setattr with the local alias is faster than a stored closure or partial per tween
+                _setattr(tween.o, tween.a, value)
+        # drop all ended tweens before the callbacks run, they might start other tweens
+        for ended in ended_tweens:
+            del active_tweens[ended]
+            self._unregister(ended)
+        if not ended_tweens:
+            return
+        # a new list for the next update, the callbacks might call update too
+        self._ended_tweens = []
+        _logger = self._logger
+        if _logger and _logger.isEnabledFor(logging.DEBUG):
+            for ended in ended_tweens:
+                _logger.debug("tween ended for obj: %s attr: %s", ended.o.__class__, ended.a)
         for ended in ended_tweens:
-            if self._logger:
-                self._logger.debug("tween ended for obj: %s attr: %s", ended.o.__class__, ended.a)
-            self._active_tweens.remove(ended)
-            ended.state = self.TweenStates.ended
             if ended.cb is not None:
-                args = list(ended.cb_args)
-                args.append(ended)
-                ended.cb(*args)
+                ended.cb(*ended.cb_args, ended)
 
     # noinspection PyUnusedLocal,PyIncorrectDocstring
     def create_tween_by_end(self, obj, attr_name, begin, end, duration, ease_function=ease_linear, params=None,
@@ -1052,6 +1651,7 @@ class Tweener(object):
 
             t as the current time of the tween
             f as the reference to the used eas function
+            ease_id as the id of the ease function in EASE_IDS, -1 for custom ease functions
 
             b as the begin value
             c as the change value
@@ -1094,7 +1694,7 @@ class Tweener(object):
                        cb_end, *cb_args)
         if do_start:
             self.start_tween(tween, immediate=immediate)
-        if self._logger:
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("tween created for obj: %s attr: %s", obj.__class__, attr_name)
         return tween
 
@@ -1116,31 +1716,93 @@ class Tweener(object):
         """
         return _Serial(self, *tweens)
 
+    def _activate(self, tween):
+        # tweens with time left to wait for the delay go to the delay queue
+        if tween._t < 0.0:
+            entry = [self._clock - tween._t, next(self._delay_sequence), tween]
+            tween._delay_entry = entry
+            heapq.heappush(self._delayed_tweens, entry)
+        else:
+            self._active_tweens[tween] = None
+
+    def _unregister(self, tween):
+        key = id(tween.o)
+        tweens = self._tweens_by_obj.get(key, None)
+        if tweens is not None:
+            tweens.pop(tween, None)
+            if not tweens:
+                del self._tweens_by_obj[key]
+
+    def _take_delayed(self, tween):
+        # removes the tween from the delay queue (setting its current time), returns False if it was not in there
+        entry = getattr(tween, "_delay_entry", None)
+        if entry is None:
+            return False
+        entry[2] = None
+        tween._delay_entry = None
+        tween._t = self._clock - entry[0]
+        return True
+
+    def _iter_delayed(self):
+        # the tweens in the delay queue
+        for _start, _, tween in self._delayed_tweens:
+            if tween is not None:
+                yield tween
+
+    def _shift_tween_time(self, tween, time):
+        # used by the serial group to move the start of a tween by the time the previous one has overrun
+        if self._take_delayed(tween):
+            tween._t += time
+            self._activate(tween)
+        else:
+            tween.t += time  # might be a group too
+
     def clear(self):
         """
         Removes all tweens from the tweener.
         """
-        self._active_tweens[:] = []
-        self._paused_tweens[:] = []
-        if self._logger:
+        for tween in self._iter_delayed():
+            tween._delay_entry = None
+        self._delayed_tweens[:] = []
+        self._active_tweens.clear()
+        self._paused_tweens.clear()
+        self._tweens_by_obj.clear()
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("cleared all tweens.")
 
     def pause_tweens(self):
         """
         Pauses all active tweens.
         """
-        self._paused_tweens.extend(self._active_tweens)
-        self._active_tweens[:] = []
-        if self._logger:
+        if self._paused_tweens:
+            self._paused_tweens.update(self._active_tweens)
+            self._active_tweens.clear()
+        else:
+            # nothing paused yet, just swap the dicts instead of copying all tweens
+            self._paused_tweens, self._active_tweens = self._active_tweens, self._paused_tweens
+        for tween in self._iter_delayed():
+            self._take_delayed(tween)
+            self._paused_tweens[tween] = None
+        self._delayed_tweens[:] = []
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("paused all tweens.")
 
     def resume_tweens(self):
         """
         Resumes all paused tweens.
         """
-        self._active_tweens.extend(self._paused_tweens)
-        self._paused_tweens[:] = []
-        if self._logger:
+        paused = self._paused_tweens
+        if self._active_tweens:
+            for tween in paused:
+                self._activate(tween)
+            paused.clear()
+        else:
+            # nothing active, swap the dicts and only move the tweens still waiting for their delay to the queue
+            self._active_tweens, self._paused_tweens = paused, self._active_tweens
+            for tween in [_tween for _tween in paused if _tween._t < 0.0]:
+                del paused[tween]
+                self._activate(tween)
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("resume all tweens.")
 
     def pause_tween(self, tween):
@@ -1149,17 +1811,17 @@ class Tweener(object):
 
         :param tween: The tween to pause (it just won't be updated, but is still registered).
         """
-        for active in self._active_tweens:
-            if tween == active:
-                self._active_tweens.remove(active)
-                self._paused_tweens.append(active)
-                tween.state = self.TweenStates.paused
-                if self._logger:
-                    self._logger.debug("tween paused for obj: %s attr: %s", tween.o.__class__, tween.a)
-                break
-        else:
-            if self._logger:
-                self._logger.debug("tween not found for pausing for obj: %s attr: %s", tween.o.__class__, tween.a)
+        try:
+            del self._active_tweens[tween]
+        except KeyError:
+            if not self._take_delayed(tween):
+                if self._logger and self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug("tween not found for pausing for obj: %s attr: %s", tween.o.__class__, tween.a)
+                return
+        self._paused_tweens[tween] = None
+        tween.state = self.TweenStates.paused
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("tween paused for obj: %s attr: %s", tween.o.__class__, tween.a)
 
     def resume_tween(self, tween):
         """
@@ -1167,21 +1829,16 @@ class Tweener(object):
 
         :param tween: The tween to resume (it will be updated again).
         """
-        for paused in self._paused_tweens:
-            if tween == paused:
-                self._paused_tweens.remove(paused)
-                self._active_tweens.append(paused)
-                tween.state = self.TweenStates.active
-                if self._logger:
-                    self._logger.debug("tween resumed for obj: %s attr: %s", tween.o.__class__, tween.a)
-                break
-            else:
-                if self._logger:
-                    self._logger.warning("trying to resume non existing or not paused tween for obj: %s attr: %s", tween
-                                         .o.__class__, tween.a)
-        else:
-            if self._logger:
+        try:
+            del self._paused_tweens[tween]
+        except KeyError:
+            if self._logger and self._logger.isEnabledFor(logging.DEBUG):
                 self._logger.debug("tween not found for resuming for obj: %s attr: %s", tween.o.__class__, tween.a)
+            return
+        self._activate(tween)
+        tween.state = self.TweenStates.active
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("tween resumed for obj: %s attr: %s", tween.o.__class__, tween.a)
 
     def remove_tween(self, tween):
         """
@@ -1189,11 +1846,11 @@ class Tweener(object):
 
         :param tween: The tween to remove.
         """
-        if tween in self._active_tweens:
-            self._active_tweens.remove(tween)
-        if tween in self._paused_tweens:
-            self._paused_tweens.remove(tween)
-        if self._logger:
+        self._active_tweens.pop(tween, None)
+        self._paused_tweens.pop(tween, None)
+        self._take_delayed(tween)
+        self._unregister(tween)
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("tween removed from active and paused for obj: %s attr: %s", tween.o.__class__, tween.a)
         tween.state = TweenStates.ended
 
@@ -1202,7 +1859,7 @@ class Tweener(object):
         Returns all tween for a given object according to the state filter. Raises an UnknownTweenStateException if a
         invalid state filter is provided.
 
-        :param obj: The object where the tween operates on.
+        :param obj: The object where the tween operates on (compared by identity).
         :param state: The filter so only tween for that object in that state are returned. If set to None all tweens
             for that object are returned. See Tweener.TweenState.
         :return: List of tweens for the given object.
@@ -1211,15 +1868,20 @@ class Tweener(object):
             raise UnknownTweenStateException(state)
 
         result = []
-        if state is None or state == self.TweenStates.active:
-            for tween in self._active_tweens:
-                if tween.o == obj:
-                    result.append(tween)
-        if state is None or state == self.TweenStates.paused:
-            for tween in self._paused_tweens:
-                if tween.o == obj:
-                    result.append(tween)
-        if self._logger:
+        paused_result = []
+        paused_tweens = self._paused_tweens
+        for tween in self._tweens_by_obj.get(id(obj), ()):
+            if tween in paused_tweens:
+                paused_result.append(tween)
+            else:
+                result.append(tween)
+        if state is None:
+            result.extend(paused_result)
+        elif state == self.TweenStates.paused:
+            result = paused_result
+        elif state != self.TweenStates.active:
+            result = []
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("get all tweens with filter '%s': %s", state, result)
         return result
 
@@ -1238,11 +1900,14 @@ class Tweener(object):
             raise TweenBelongsToOtherTweenerException("Tween has been created with another tweener!")
 
         # reset tween
-        tween.t = -float(tween.delay)
+        delay = tween.delay
+        tween._t = -delay if type(delay) is float else -float(delay)
         tween.v = tween.b
+        tween._precompute_ease_params()
 
         # make it active
-        self._active_tweens.append(tween)
+        self._activate(tween)
+        self._tweens_by_obj.setdefault(id(tween.o), {})[tween] = None
         tween.state = self.TweenStates.active
 
         # calculate first value if immediate is True
@@ -1263,10 +1928,11 @@ class Tweener(object):
 
         result = []
         if state is None or state == self.TweenStates.active:
-            result += list(self._active_tweens)
+            result.extend(self._active_tweens)
+            result.extend(self._iter_delayed())
 
         if state is None or state == self.TweenStates.paused:
-            result += list(self._paused_tweens)
+            result.extend(self._paused_tweens)
 
         return result
 
@@ -1330,6 +1996,133 @@ ease_functions = [
 
 ]
 
+EASE_IDS = dict((_f, _i) for _i, _f in enumerate(ease_functions))
+"""
+The integer id of each predefined ease function, its index in ease_functions (ease_functions[EASE_IDS[f]] is f).
+Custom ease functions have no id, their tweens get -1 as ease_id.
+"""
+
+vectorized_ease_functions = {} if np is None else {
+    ease_in_sine: ease_in_sine_vec,
+    ease_out_sine: ease_out_sine_vec,
+    ease_in_out_sine: ease_in_out_sine_vec,
+    ease_out_in_sine: ease_out_in_sine_vec,
+
+    ease_in_quad: ease_in_quad_vec,
+    ease_out_quad: ease_out_quad_vec,
+    ease_in_out_quad: ease_in_out_quad_vec,
+    ease_out_in_quad: ease_out_in_quad_vec,
+
+    ease_in_cubic: ease_in_cubic_vec,
+    ease_out_cubic: ease_out_cubic_vec,
+    ease_in_out_cubic: ease_in_out_cubic_vec,
+    ease_out_in_cubic: ease_out_in_cubic_vec,
+
+    ease_in_quart: ease_in_quart_vec,
+    ease_out_quart: ease_out_quart_vec,
+    ease_in_out_quart: ease_in_out_quart_vec,
+    ease_out_in_quart: ease_out_in_quart_vec,
+
+    ease_in_quint: ease_in_quint_vec,
+    ease_out_quint: ease_out_quint_vec,
+    ease_in_out_quint: ease_in_out_quint_vec,
+    ease_out_in_quint: ease_out_in_quint_vec,
+
+    ease_in_expo: ease_in_expo_vec,
+    ease_out_expo: ease_out_expo_vec,
+    ease_in_out_expo: ease_in_out_expo_vec,
+    ease_out_in_expo: ease_out_in_expo_vec,
+
+    ease_in_circ: ease_in_circ_vec,
+    ease_out_circ: ease_out_circ_vec,
+    ease_in_out_circ: ease_in_out_circ_vec,
+    ease_out_in_circ: ease_out_in_circ_vec,
+
+    ease_in_elastic: ease_in_elastic_vec,
+    ease_out_elastic: ease_out_elastic_vec,
+    ease_in_out_elastic: ease_in_out_elastic_vec,
+    ease_out_in_elastic: ease_out_in_elastic_vec,
+
+    ease_in_back: ease_in_back_vec,
+    ease_out_back: ease_out_back_vec,
+    ease_in_out_back: ease_in_out_back_vec,
+    ease_out_in_back: ease_out_in_back_vec,
+
+    ease_in_bounce: ease_in_bounce_vec,
+    ease_out_bounce: ease_out_bounce_vec,
+    ease_in_out_bounce: ease_in_out_bounce_vec,
+    ease_out_in_bounce: ease_out_in_bounce_vec,
+
+    ease_linear: ease_linear_vec,
+    ease_in_sine2: ease_in_sine2_vec,
+    ease_in_sine3: ease_in_sine3_vec,
+}
+"""
+The numpy counterparts of the ease functions (empty without numpy). They take arrays for t, b, c and d and compute
+the values of many tweens at once, e.g. vectorized_ease_functions[ease_out_quad](t_arr, b_arr, c_arr, d_arr, None).
+The random bounce has no counterpart.
+"""
+
+_fast_ease_functions = {
+    ease_in_elastic: (ease_in_elastic_fast, _ease_in_elastic_params),
+    ease_out_elastic: (ease_out_elastic_fast, _ease_out_elastic_params),
+    ease_in_out_elastic: (ease_in_out_elastic_fast, _ease_in_out_elastic_params),
+
+    ease_in_back: (ease_in_back_fast, _ease_back_params),
+    ease_out_back: (ease_out_back_fast, _ease_back_params),
+    ease_in_out_back: (ease_in_out_back_fast, _ease_in_out_back_params),
+
+    ease_in_expo: (ease_in_expo_fast, _ease_expo_params),
+    ease_out_expo: (ease_out_expo_fast, _ease_expo_params),
+    ease_in_out_expo: (ease_in_out_expo_fast, _ease_expo_params),
+}
+"""Maps the ease functions to (specialized ease function, function precomputing its last argument from c, d, p)."""
+
+
+def tween_at(begin, change, t, d, ease=ease_linear, p=None, out=None):
+    """
+    Calculates the values of an ease function for many points at once, without creating any tweens (e.g. for particles
+    or to bake keyframes). The time is clamped to [0, d] like the tweener does, so the values before the start are
+    begin and after the end begin + change.
+
+    With numpy and an ease function that has a counterpart in vectorized_ease_functions, all values are computed by
+    one vectorized call and returned as a numpy array. Otherwise the ease function is called for each value and the
+    values are returned packed in an array.array('d') (8 bytes per value instead of a float object each).
+
+    To keep the values in one place, e.g. a buffer the renderer reads every frame, pass it as out: the values are
+    written into it (out[:] = values) and out is returned instead of a new array.
+
+    :param begin: the begin value(s), a number or a sequence/array of the same length as t
+    :param change: the change value(s), a number or a sequence/array of the same length as t
+    :param t: the times to evaluate, a sequence/array
+    :param d: the duration(s), a number or a sequence/array of the same length as t
+    :param ease: the ease function or its id from EASE_IDS, default is :py:meth:`ease_linear`
+    :param p: the parameters for the ease function, see ease function description for details
+    :param out: optional float buffer of the same length as t to write the values into (numpy array, array('d') or
+        list), default is None
+    :return: the values at the times t (out if given)
+    """
+    if not callable(ease):
+        ease = ease_functions[ease]
+    vectorized = vectorized_ease_functions.get(ease, None)
+    if vectorized is not None:
+        d = np.asarray(d, dtype=float)
+        t = np.minimum(np.maximum(np.asarray(t, dtype=float), 0.0), d)
+        values = vectorized(t, np.asarray(begin, dtype=float), np.asarray(change, dtype=float), d, p)
+    else:
+        count = len(t)
+        begin = begin if hasattr(begin, '__len__') else [begin] * count
+        change = change if hasattr(change, '__len__') else [change] * count
+        d = d if hasattr(d, '__len__') else [d] * count
+        values = array('d', [ease(min(max(_t, 0.0), _d), _b, _c, _d, p) for _t, _b, _c, _d in zip(t, begin, change, d)])
+    if out is None:
+        return values
+    if isinstance(out, array) and not isinstance(values, array):
+        values = array(out.typecode, values)  # an array slice can only be assigned from an array
+    out[:] = values
+    return out
+
+
 logger.debug("imported")
 
 if __name__ == '__main__':  # pragma: nocover
@@ -1361,13 +2154,23 @@ if __name__ == '__main__':  # pragma: nocover
                 self.end = end
                 self.label = label
 
-            def draw(self, surf):
+            def draw_static(self, surf):
                 start_pos = (self.start, self.box.centery)
                 end_pos = (self.end, self.box.centery)
                 pygame.draw.line(surf, grey, start_pos, end_pos, 3)
+                surf.blit(self.label, (self.start, self.box.bottom + self.label.get_size()[1] / 3))
+
+            def draw(self, surf):
                 pygame.draw.rect(surf, red, self.box)
                 surf.set_at(self.box.center, white)
-                surf.blit(self.label, (self.start, self.box.bottom + self.label.get_size()[1] / 3))
+
+        # noinspection PyShadowingNames
+        def render_background(surf, boxes, sliders):
+            # the boxes, the slider lines and the labels do not move, they are drawn once per reset
+            surf.fill((0, 0, 0))
+            for idx, box in enumerate(boxes):
+                box.draw(surf, blue1)
+                sliders[idx].draw_static(surf)
 
         # noinspection PyShadowingNames
         def reset(screen_w, tile_w, tile_h, spacing, margin, ease_functions, duration, trail_rects, boxes, tweener,
@@ -1399,7 +2202,9 @@ if __name__ == '__main__':  # pragma: nocover
                 params = (-tile_h, 0) if func.__name__ == "ease_random_int_bounce" else None
                 tweener.create_tween(r, "centerx", r.centerx, tile_w, duration, ease_linear)
                 tweener.create_tween(r, "centery", r.centery, -tile_h, duration, func, params)
-                trails[id(r)] = [r.center]  # add first point here so pygame.draw.lines has two points at first draw
+                # add the first point twice, so pygame.draw.lines has two points even if a frame is drawn before
+                # the first fixed step update
+                trails[id(r)] = [r.center, r.center]
 
                 # boxes
                 label = font.render(func.__name__, 1, white)
@@ -1417,11 +2222,14 @@ if __name__ == '__main__':  # pragma: nocover
                 tweener.create_tween(r, "centerx", r.centerx, slider_length, duration, func, params)
                 slider = Slider(r, left, left + slider_length, label)
                 sliders.append(slider)
-                trails[id(slider)] = [slider.box.center]
+                trails[id(slider)] = [slider.box.center, slider.box.center]
 
         import pygame
 
         pygame.init()
+        # only the handled events are queued, the others (e.g. mouse motion) are dropped by SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         screen_w = 1024
         screen_h = 900
 
@@ -1449,6 +2257,8 @@ if __name__ == '__main__':  # pragma: nocover
         reset(screen_w, tile_w, tile_h, spacing, margin, ease_functions, duration, tween_objects, boxes, tweener,
               trails,
               sliders)
+        background = pygame.Surface((screen_w, screen_h)).convert()
+        render_background(background, boxes, sliders)
 
         # instructions
         font30 = pygame.font.Font(None, 30)
@@ -1458,55 +2268,87 @@ if __name__ == '__main__':  # pragma: nocover
         instr_rect.centerx = screen_w * 0.5
         instr_rect.bottom = screen_h - margin
 
+        # pre-rendered dot for the tweened objects
+        dot_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(dot_surf, red, (2, 2), 2)
+
+        # the trail points are written once into this layer when recorded instead of every point each frame
+        points_layer = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA).convert_alpha()
+        for t in trails.values():
+            for p in t:
+                points_layer.set_at(p, white)
+
         clock = pygame.time.Clock()
         running = True
 
+        # bound once for the main loop
+        _event_get = pygame.event.get
+        _draw_lines = pygame.draw.lines
+        _flip = pygame.display.flip
+        _blit = screen.blit
+        _set_point = points_layer.set_at
+        _tick = clock.tick
+        _update = tweener.update
+        _QUIT = pygame.QUIT
+        _KEYDOWN = pygame.KEYDOWN
+        _K_ESCAPE = pygame.K_ESCAPE
+
+        fixed_dt = 1.0 / 60.0
+        max_steps = 5  # at most that many updates per frame, the animation slows down instead of stalling
+        accumulator = 0.0
+
         # main loop
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in _event_get():
+                if event.type == _QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                elif event.type == _KEYDOWN:
+                    if event.key == _K_ESCAPE:
                         running = False
                     else:
                         reset(screen_w, tile_w, tile_h, spacing, margin, ease_functions, duration, tween_objects, boxes,
                               tweener, trails, sliders)
-
-            # update
-            dt = clock.tick(60) * 0.001  # convert to seconds
-            tweener.update(dt)
-
-            # record current position for drawing the trail
-            for r in tween_objects:
-                trails[id(r)].append(r.center)
-            for s in sliders:
-                trails[id(s)].append(s.box.center)
+                        render_background(background, boxes, sliders)
+                        points_layer.fill((0, 0, 0, 0))
+                        for t in trails.values():
+                            _set_point(t[0], white)
+
+            # update in fixed steps, so the trails get the same points independent of the frame rate
+            accumulator = min(accumulator + _tick(60) * 0.001, max_steps * fixed_dt)  # convert to seconds
+            while accumulator >= fixed_dt:
+                accumulator -= fixed_dt
+                _update(fixed_dt)
+
+                # record current position for drawing the trail
+                for r in tween_objects:
+                    point = r.center
+                    trails[id(r)].append(point)
+                    _set_point(point, white)
+                for s in sliders:
+                    point = s.box.center
+                    trails[id(s)].append(point)
+                    _set_point(point, white)
 
             # draw
-            screen.fill((0, 0, 0))
+            _blit(background, (0, 0))
 
-            # draw boxes and sliders
-            for idx, box in enumerate(boxes):
-                box.draw(screen, blue1)
-                sliders[idx].draw(screen)
+            # draw sliders
+            for slider in sliders:
+                slider.draw(screen)
 
             # draw trail of tweened objects
             for t in trails.values():
                 # pygame.draw.lines(screen, grey, 0, t, 1)
-                pygame.draw.lines(screen, blue, 0, t, 1)
-                for p in t:
-                    screen.set_at(p, white)
+                _draw_lines(screen, blue, 0, t, 1)
+            _blit(points_layer, (0, 0))
 
             # draw tweened objects
-            for r in tween_objects:
-                # pygame.draw.rect(screen, (255, 0, 0), r, 0)
-                pygame.draw.circle(screen, red, r.center, 2)
+            screen.fblits([(dot_surf, (r.centerx - 2, r.centery - 2)) for r in tween_objects])
 
             # draw instructions
-            screen.blit(instructions_label, instr_rect)
+            _blit(instructions_label, instr_rect)
 
-            pygame.display.flip()
+            _flip()
 
 
     def show_grouping_demo():  # pragma: no cover
@@ -1516,23 +2358,57 @@ if __name__ == '__main__':  # pragma: nocover
         import pygame
 
         pc = pygame.Color
+        # shared by all examples instead of parsing the color names each time an example is built
+        red = pc('red')
+        green = pc('green')
+        blue = pc('blue')
+        grey = pc('grey')
+        dark_green = pc('dark green')
+        white = pc('white')
         use_random_ease_function = False
 
-        def activate_tween(the_tests, current):
+        test_cache = {}  # {(test index, use_random_ease_function): (tween, dots, start positions of the dots)}
+
+        def activate_tween(the_tests, current, rebuild=False):
             _test = the_tests[current]
             print()
             print("running", _test.__name__)
-            _tween, _dots = _test(the_tweener, the_begin, the_change, the_duration)
+            key = (current % len(the_tests), use_random_ease_function)
+            cached = None if rebuild else test_cache.get(key, None)
+            if cached is None:
+                _tween, _dots = _test(the_tweener, the_begin, the_change, the_duration)
+                test_cache[key] = (_tween, _dots, [(_d.x, _d.y) for _d in _dots])
+            else:
+                # reuse the tweens of the test, only the dots have to be put back
+                _tween, _dots, positions = cached
+                for _d, (_x, _y) in zip(_dots, positions):
+                    _d.x = _x
+                    _d.y = _y
             _tween.start()
             caption = "{0} |space: repeat |left/right arrow: prev/next test |f: {1} rand ease func |r: randomize".format(
                 str(_test.__name__),
                 str(use_random_ease_function))
             pygame.display.set_caption(caption)
-            return _dots, [], _tween
+            trail_layer.fill((0, 0, 0, 0))
+            prev_dot_rects[:] = [screen.get_rect()]  # redraw the whole screen once
+            return _dots, _tween
+
+        circle_surfaces = {}  # {(color, radius): surface}
+
+        def get_circle(color, radius):
+            # pre-rendered circle to blit instead of drawing it each frame
+            key = (tuple(color), radius)
+            surf = circle_surfaces.get(key, None)
+            if surf is None:
+                surf = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+                pygame.draw.circle(surf, color, (radius, radius), radius)
+                circle_surfaces[key] = surf
+            return surf
 
         class Dot(object):
+            __slots__ = ('x', 'y', 'radius', 'color')
 
-            def __init__(self, x=0, y=0, color=pygame.Color('white')):
+            def __init__(self, x=0, y=0, color=white):
                 self.x = x
                 self.y = y
                 self.color = color
@@ -1556,7 +2432,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         def create_n_dots(count, x, y, h, color=None):
             if color is None:
-                color = [pygame.Color('white')]
+                color = [white]
             if len(color) < count:
                 color = color * count
             _dots = []
@@ -1566,7 +2442,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyUnusedLocal
         def one_after_other(tweener, begin, change, duration):
-            _dots = create_n_dots(3, begin, 100, 50, color=[pc('red'), pc('green'), pc('blue')])
+            _dots = create_n_dots(3, begin, 100, 50, color=[red, green, blue])
             _tween0, _tween1, _tween2 = create_n_tweens(_dots, tweener, begin, change, duration)
             _tween = _tween0.next(_tween1).next(_tween2)
             return _tween, _dots
@@ -1590,18 +2466,18 @@ if __name__ == '__main__':  # pragma: nocover
         def nested_serial(tweener, begin, change, duration):
             h = 50
             _dots = [
-                Dot(x=begin, y=h + 1 * h, color=pygame.Color('red')),
-                Dot(x=begin, y=h + 2 * h, color=pygame.Color('red')),
+                Dot(x=begin, y=h + 1 * h, color=red),
+                Dot(x=begin, y=h + 2 * h, color=red),
             ]
 
             _nest1, _dots1 = repeat_serial_2_times(tweener, begin, change, duration)
             for idx, _d in enumerate(_dots1):
-                _d.color = pygame.Color('green')
+                _d.color = green
                 _d.y = 4 * h + idx * h
 
             _nest2, _dots2 = repeat_serial_2_times(tweener, begin, change, duration)
             for idx, _d in enumerate(_dots2):
-                _d.color = pygame.Color('blue')
+                _d.color = blue
                 _d.y = (len(_dots1) + 2) * h + (idx + len(_dots1)) * h
 
             _tween0 = tweener.create_tween(_dots[0], 'x', begin, change, duration, do_start=False,
@@ -1620,7 +2496,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyUnusedLocal
         def two_series_of_parallels(tweener, begin, change, duration):
-            _dots = create_n_dots(6, begin, 100, 50, color=[pc('red')] * 3 + [pc('green')] * 3)
+            _dots = create_n_dots(6, begin, 100, 50, color=[red] * 3 + [green] * 3)
             _t1, _t2, _t3, _t4, _t5, _t6 = create_n_tweens(_dots, tweener, begin, change, duration)
             p1 = _t1.parallel(_t2).parallel(_t3)
             p2 = _t4.parallel(_t5).parallel(_t6)
@@ -1629,7 +2505,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyUnusedLocal
         def parallel_series(tweener, begin, change, duration):
-            _dots = create_n_dots(6, begin, 100, 50, color=[pc('red')] * 3 + [pc('green')] * 3)
+            _dots = create_n_dots(6, begin, 100, 50, color=[red] * 3 + [green] * 3)
             _t1, _t2, _t3, _t4, _t5, _t6 = create_n_tweens(_dots, tweener, begin, change, duration)
             s1 = _t1.next(_t2).next(_t3)
             s2 = _t4.next(_t5).next(_t6)
@@ -1638,7 +2514,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyUnusedLocal
         def nested_parallels(tweener, begin, change, duration):
-            _dots = create_n_dots(3, begin, 100, 50, color=[pc('red'), pc('green'), pc('blue')])
+            _dots = create_n_dots(3, begin, 100, 50, color=[red, green, blue])
             _t1, _t2, _t3 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = _t1.parallel(_t2).parallel(_t3)
             return parallel, _dots
@@ -1646,7 +2522,7 @@ if __name__ == '__main__':  # pragma: nocover
         # noinspection PyUnusedLocal
         def gumm_rgb_test_1(tweener, begin, change, duration):
             """move r, g, and b up and down in one series, repeated twice"""
-            _dots = create_n_dots(4, begin, 100, 50, color=[pc('red'), pc('green'), pc('blue'), pc('grey')])
+            _dots = create_n_dots(4, begin, 100, 50, color=[red, green, blue, grey])
 
             TC = tweener.create_tween
             dum = TC(_dots[3], 'x', begin + 0, 1, 0.00001, do_start=False, ease_function=rnd_ease())
@@ -1740,7 +2616,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyPep8Naming
         def example_c388_P_next_t3(tweener, begin, change, duration):
-            colors = [pc('dark green'), pc('dark green'), pc('white')]
+            colors = [dark_green, dark_green, white]
             _dots = create_n_dots(3, begin, 100, 50, color=colors)
             t1, t2, t3 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = t1.parallel(t2)
@@ -1749,7 +2625,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyPep8Naming
         def example_c389_P_next_t3_t4_t5(tweener, begin, change, duration):
-            colors = [pc('dark green'), pc('dark green'), pc('white'), pc('white'), pc('white')]
+            colors = [dark_green, dark_green, white, white, white]
             _dots = create_n_dots(5, begin, 100, 50, color=colors)
             t1, t2, t3, t4, t5 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = t1.parallel(t2)
@@ -1758,7 +2634,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyPep8Naming
         def example_c390_P_parallel_t3(tweener, begin, change, duration):
-            colors = [pc('dark green'), pc('dark green'), pc('white')]
+            colors = [dark_green, dark_green, white]
             _dots = create_n_dots(3, begin, 100, 50, color=colors)
             t1, t2, t3 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = t1.parallel(t2)
@@ -1767,7 +2643,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyPep8Naming
         def example_c391_P_parallel_t3_t4_t5(tweener, begin, change, duration):
-            colors = [pc('dark green'), pc('dark green'), pc('white'), pc('white'), pc('white')]
+            colors = [dark_green, dark_green, white, white, white]
             _dots = create_n_dots(5, begin, 100, 50, color=colors)
             t1, t2, t3, t4, t5 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = t1.parallel(t2)
@@ -1776,7 +2652,7 @@ if __name__ == '__main__':  # pragma: nocover
 
         # noinspection PyPep8Naming
         def example_c392_P_repeat_3(tweener, begin, change, duration):
-            _dots = create_n_dots(2, begin, 100, 50, color=[pc('dark green'), pc('dark green'), pc('white')])
+            _dots = create_n_dots(2, begin, 100, 50, color=[dark_green, dark_green, white])
             t1, t2 = create_n_tweens(_dots, tweener, begin, change, duration)
             parallel = t1.parallel(t2)
             chain = parallel.repeat(3)
@@ -1844,15 +2720,27 @@ if __name__ == '__main__':  # pragma: nocover
             return chain, _dots
 
         pygame.init()
+        # only the handled events are queued, the others (e.g. mouse motion) are dropped by SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         the_screen_size = (800, 600)
         screen = pygame.display.set_mode(the_screen_size)
+        # the trail is drawn once into this layer, only the points of the current frame are added each frame
+        trail_layer = pygame.Surface(the_screen_size, pygame.SRCALPHA).convert_alpha()
         clock = pygame.time.Clock()
         the_tweener = Tweener()
 
         the_begin = 100
         the_change = 200
         the_duration = 1
-        tests = [
+
+        # static background, only the rects of the dots are redrawn from it each frame
+        bg_surface = pygame.Surface(the_screen_size).convert()
+        bg_surface.fill((0, 0, 0))
+        bg_surface.fill((50, 50, 50), pygame.Rect(the_begin, 0, the_change, the_screen_size[1]))
+        prev_dot_rects = []  # the rects of the dots drawn in the last frame
+
+        tests = (
             # repeat_tween_4_times,
             # one_after_other,
             # repeat_serial_2_times,
@@ -1888,9 +2776,10 @@ if __name__ == '__main__':  # pragma: nocover
             example_G_c496_t1_parallel_t2_parallel_t3_t4_t5_parallel_t6,
             example_c497_t1_parallel_t2__t3_next_t4_next_t5__t6,
             example_G_c497_t1_parallel_t2__t3_next_t4_next_t5__t6,
-        ]
+        )
+        test_count = len(tests)
         current_test = -1
-        dots, trails, current_tween = activate_tween(tests, current_test)
+        dots, current_tween = activate_tween(tests, current_test)
 
         running = True
         while running:
@@ -1902,15 +2791,16 @@ if __name__ == '__main__':  # pragma: nocover
                     if event.key == pygame.K_ESCAPE:
                         running = False
                     elif event.key == pygame.K_r:
-                        dots, trails, current_tween = activate_tween(tests, current_test)
+                        # only random ease functions give different tweens, otherwise the cached ones are restarted
+                        dots, current_tween = activate_tween(tests, current_test, rebuild=use_random_ease_function)
                     elif event.key == pygame.K_SPACE:
                         for d in dots:
                             d.x = the_begin
                         current_tween.start(immediate=True)
                     elif event.key in (pygame.K_RIGHT, pygame.K_LEFT):
                         current_test += -1 if event.key == pygame.K_LEFT else 1
-                        current_test %= len(tests)
-                        dots, trails, current_tween = activate_tween(tests, current_test)
+                        current_test %= test_count
+                        dots, current_tween = activate_tween(tests, current_test)
                     elif event.key == pygame.K_f:
                         use_random_ease_function = not use_random_ease_function
 
@@ -1918,17 +2808,28 @@ if __name__ == '__main__':  # pragma: nocover
             dt = clock.tick(30) / 1000.0  # convert to seconds
             the_tweener.update(dt)
 
-            # draw
-            screen.fill((0, 0, 0))
-            screen.fill((50, 50, 50), pygame.Rect(the_begin, 0, the_change, the_screen_size[1]))
-            for trail in trails:
-                pygame.draw.circle(*trail)
+            # draw, the dots of the last frame are covered with the background and the trail
+            for r in prev_dot_rects:
+                screen.blit(bg_surface, r, r)
+                screen.blit(trail_layer, r, r)
 
+            dot_blits = []
+            trail_blits = []
+            dot_rects = []
             for dot in dots:
-                pygame.draw.circle(screen, dot.color, (int(dot.x), int(dot.y)), dot.radius)
-                trails.append((screen, dot.color, (int(dot.x), int(dot.y)), 2))
+                # the blit positions may be floats, pygame truncates them in C like int() would
+                x = dot.x
+                y = dot.y
+                radius = dot.radius
+                dot_blits.append((get_circle(dot.color, radius), (x - radius, y - radius)))
+                trail_blits.append((get_circle(dot.color, 2), (x - 2, y - 2)))
+                # the trail point lies within the rect of the dot, so it is redrawn with it
+                dot_rects.append(pygame.Rect(x - radius, y - radius, 2 * radius, 2 * radius))
+            trail_layer.fblits(trail_blits)
+            screen.fblits(dot_blits)
 
-            pygame.display.flip()
+            pygame.display.update(prev_dot_rects + dot_rects)
+            prev_dot_rects = dot_rects
 
 
     def show_vector_demo():
@@ -1938,6 +2839,9 @@ if __name__ == '__main__':  # pragma: nocover
         import pygame
 
         pygame.init()
+        # only the handled events are queued, the others (e.g. mouse motion) are dropped by SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         screen_w = 1024
         screen_h = 900
 
@@ -1956,20 +2860,41 @@ if __name__ == '__main__':  # pragma: nocover
             def __init__(self):
                 self.position = pygame.Vector2(100, 100)
                 self.prev_position = pygame.Vector2()
+                # scratch vectors for draw_arrow, updated in place each frame
+                self._direction = pygame.Vector2()
+                self._end = pygame.Vector2()
+                self._to_mid = pygame.Vector2()
+                self._left = pygame.Vector2()
+                self._right = pygame.Vector2()
                 self.update()
 
             def update(self):
                 self.prev_position.update(self.position)
 
             def draw_arrow(self, screen, scale=1.0):
-                direction = (self.position - self.prev_position) * scale
-                end = self.position + direction
-                to_mid = direction * 0.33
-                if to_mid.length() > 10:
-                    to_mid = to_mid.normalize() * 10
-                mid = end - to_mid
-                left = mid + (end - mid).rotate(90)
-                right = mid + (end - mid).rotate(-90)
+                direction = self._direction
+                direction.update(self.position)
+                direction -= self.prev_position
+                direction *= scale
+                end = self._end
+                end.update(self.position)
+                end += direction
+                to_mid = self._to_mid  # this is end - mid
+                to_mid.update(direction)
+                to_mid *= 0.33
+                if to_mid.length_squared() > 100:
+                    to_mid.scale_to_length(10)
+                # left = mid + (end - mid).rotate(90) with mid = end - to_mid
+                left = self._left
+                left.update(to_mid)
+                left.rotate_ip(90)
+                left -= to_mid
+                left += end
+                right = self._right
+                right.update(to_mid)
+                right.rotate_ip(-90)
+                right -= to_mid
+                right += end
                 pygame.draw.line(screen, yellow, self.position, end, 3)
                 pygame.draw.line(screen, yellow, end, left, 3)
                 pygame.draw.line(screen, yellow, end, right, 3)
@@ -2055,13 +2980,33 @@ if __name__ == '__main__':  # pragma: nocover
 
         pygame.event.clear()
 
+        # pre-rendered saucer to blit all of them at once
+        saucer_surf = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(saucer_surf, white, (20, 20), 20)
+
+        # bound once for the main loop
+        _event_get = pygame.event.get
+        _draw_circle = pygame.draw.circle
+        _draw_line = pygame.draw.line
+        _flip = pygame.display.flip
+        _fill = screen.fill
+        _tick = clock.tick
+        _update = tweener.update
+        _QUIT = pygame.QUIT
+        _KEYDOWN = pygame.KEYDOWN
+        _K_ESCAPE = pygame.K_ESCAPE
+
+        fixed_dt = 1.0 / 60.0
+        max_steps = 5  # at most that many updates per frame, the animation slows down instead of stalling
+        accumulator = 0.0
+
         # main loop
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in _event_get():
+                if event.type == _QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                elif event.type == _KEYDOWN:
+                    if event.key == _K_ESCAPE:
                         running = False
                     else:
                         # reset
@@ -2071,25 +3016,28 @@ if __name__ == '__main__':  # pragma: nocover
                                                             target, duration,
                                                             ease_out_bounce)
 
-            # update
-            for flying_saucer in saucers:
-                flying_saucer.update()  # store current position
-            dt = clock.tick(60) * 0.001  # convert to seconds
-            tweener.update(dt)
+            # update in fixed steps, the arrows show the movement of the last step
+            accumulator = min(accumulator + _tick(60) * 0.001, max_steps * fixed_dt)  # convert to seconds
+            while accumulator >= fixed_dt:
+                accumulator -= fixed_dt
+                for flying_saucer in saucers:
+                    flying_saucer.update()  # store current position
+                _update(fixed_dt)
 
             # draw
-            screen.fill((0, 0, 0))
+            _fill((0, 0, 0))
+
+            # start and target of the last saucer (the one reset by a key press), the same for each saucer
+            _draw_circle(screen, red, start, 5)
+            _draw_circle(screen, blue, target, 5)
+            _draw_line(screen, grey, start, target)
 
             # draw tweened objects
+            screen.fblits([(saucer_surf, (_s.position.x - 20, _s.position.y - 20)) for _s in saucers])
             for flying_saucer in saucers:
-                pygame.draw.circle(screen, red, start, 5)
-                pygame.draw.circle(screen, blue, target, 5)
-                pygame.draw.line(screen, grey, start, target)
-                pygame.draw.circle(screen, white, flying_saucer.position, 20)
-
                 flying_saucer.draw_arrow(screen, 25)
 
-            pygame.display.flip()
+            _flip()
 
 
     show_vector_demo()
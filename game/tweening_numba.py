@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Optional numba kernel for the bulk evaluation of the most used ease functions.
+
+This module needs numba (and numpy), which are not required by the game, so it is only imported on demand:
+
+.. code:: python
+
+    try:
+        from game.tweening_numba import tween_at
+    except ImportError:
+        from game.tweening import tween_at
+
+    values = tween_at(begin_arr, change_arr, t_arr, 2.0, tweening.ease_out_quad)
+
+The kernel runs in parallel over all elements and uses fastmath, so the values may differ from the scalar ease functions
+in the last bits. Ease functions not supported by the kernel are delegated to :py:meth:`game.tweening.tween_at`.
+
+The kernel dispatches on an integer kind per value, so tweens_at evaluates values with different ease functions (given
+by their ids from game.tweening.EASE_IDS, e.g. collected from tween.ease_id) in one call.
+step_tweens additionally advances the times in the same pass, for tweens kept in arrays instead of _Tween
+instances (one kernel call per frame for all of them).
+"""
+import logging
+from array import array
+
+import numpy as np
+from numba import njit
+from numba import prange
+
+from game import tweening
+
+logger = logging.getLogger(__name__)
+logger.debug("importing...")
+
+EASE_KINDS = {
+    tweening.ease_linear: 0,
+    tweening.ease_in_quad: 1,
+    tweening.ease_out_quad: 2,
+    tweening.ease_in_out_quad: 3,
+    tweening.ease_in_cubic: 4,
+    tweening.ease_out_cubic: 5,
+    tweening.ease_in_out_cubic: 6,
+    tweening.ease_in_sine: 7,
+    tweening.ease_out_sine: 8,
+    tweening.ease_in_out_sine: 9,
+    tweening.ease_in_expo: 10,
+    tweening.ease_out_expo: 11,
+    tweening.ease_in_out_expo: 12,
+}
+"""The ease functions supported by the kernel and their kind code used inside the kernel."""
+
+_KINDS_BY_EASE_ID = np.full(len(tweening.ease_functions), -1, dtype=np.int64)
+for _ease, _kind in EASE_KINDS.items():
+    _KINDS_BY_EASE_ID[tweening.EASE_IDS[_ease]] = _kind
+del _ease, _kind
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ease_kernel(kinds, t, b, c, d, dt, out):  # pragma: nocover
+    half_pi = np.pi / 2.0
+    for i in prange(t.shape[0]):
+        kind = kinds[i]
+        di = d[i]
+        ti = t[i]
+        if dt != 0.0:
+            # advance the time in the same pass
+            ti += dt
+            t[i] = ti
+        ti = min(max(ti, 0.0), di)
+        bi = b[i]
+        ci = c[i]
+        if kind == 0:
+            value = ci * ti / di + bi
+        elif kind == 1:
+            u = ti / di
+            value = ci * u * u + bi
+        elif kind == 2:
+            u = ti / di
+            value = -ci * u * (u - 2) + bi
+        elif kind == 3:
+            u = ti / (di * 0.5)
+            if u < 1:
+                value = ci * 0.5 * u * u + bi
+            else:
+                u -= 1
+                value = -ci * 0.5 * (u * (u - 2) - 1) + bi
+        elif kind == 4:
+            u = ti / di
+            value = ci * u * u * u + bi
+        elif kind == 5:
+            u = ti / di - 1
+            value = ci * (u * u * u + 1) + bi
+        elif kind == 6:
+            u = ti / (di * 0.5)
+            if u < 1:
+                value = ci * 0.5 * u * u * u + bi
+            else:
+                u -= 2
+                value = ci * 0.5 * (u * u * u + 2) + bi
+        elif kind == 7:
+            value = -ci * np.cos(ti / di * half_pi) + ci + bi
+        elif kind == 8:
+            value = ci * np.sin(ti / di * half_pi) + bi
+        elif kind == 9:
+            value = -ci * 0.5 * (np.cos(np.pi * ti / di) - 1) + bi
+        elif kind == 10:
+            value = bi if ti == 0 else ci * 2.0 ** (10 * (ti / di - 1)) + bi - ci * 0.001
+        elif kind == 11:
+            value = bi + ci if ti == di else ci * (-2.0 ** (-10 * ti / di) + 1) + bi
+        elif kind == 12:
+            if ti == 0:
+                value = bi
+            elif ti == di:
+                value = bi + ci
+            else:
+                u = ti / (di * 0.5)
+                if u < 1:
+                    value = ci * 0.5 * 2.0 ** (10 * (u - 1)) + bi - ci * 0.0005
+                else:
+                    value = ci * 0.5 * 1.0005 * (-2.0 ** (-10 * (u - 1)) + 2) + bi
+        else:
+            value = np.nan  # not supported by the kernel, computed outside
+        out[i] = value
+
+
+def tween_at(begin, change, t, d, ease=tweening.ease_linear, p=None, out=None):
+    """
+    Same as :py:meth:`game.tweening.tween_at` but computes the ease functions from EASE_KINDS with a compiled kernel.
+    The kernel writes directly into out if it is a contiguous float64 numpy array of matching length, the values are
+    copied into other out buffers (like a list or array('d')).
+
+    :return: out if given, else the values at the times t as numpy array (or as returned by game.tweening.tween_at
+        for other eases)
+    """
+    if not callable(ease):
+        ease = tweening.ease_functions[ease]
+    kind = EASE_KINDS.get(ease, None)
+    if kind is None:
+        return tweening.tween_at(begin, change, t, d, ease, p, out)
+    t, b, c, d = np.broadcast_arrays(*(np.asarray(_v, dtype=np.float64) for _v in (t, begin, change, d)))
+    t, b, c, d = (np.ascontiguousarray(_v) for _v in (t, b, c, d))
+    count = t.shape[0]
+    values = out if _is_kernel_buffer(out, count) else np.empty(count, dtype=np.float64)
+    _ease_kernel(np.full(count, kind, dtype=np.int64), t, b, c, d, 0.0, values)
+    return _copy_to_out(values, out)
+
+
+def tweens_at(ease_ids, begin, change, t, d, p=None):
+    """
+    Like tween_at (without out) but with an ease function per value, given by its id from game.tweening.EASE_IDS (as in
+    tween.ease_id), so tweens with different ease functions are computed by one kernel call. Values with an ease
+    function not in EASE_KINDS are computed per ease function by :py:meth:`game.tweening.tween_at`. Custom ease
+    functions (id -1) are not supported, a ValueError is raised for any id that is not in EASE_IDS.
+
+    :return: the values at the times t as numpy array
+    """
+    ease_ids, t, b, c, d = np.broadcast_arrays(np.asarray(ease_ids, dtype=np.int64),
+                                               *(np.asarray(_v, dtype=np.float64) for _v in (t, begin, change, d)))
+    ease_ids, t, b, c, d = (np.ascontiguousarray(_v) for _v in (ease_ids, t, b, c, d))
+    return _tweens_at(ease_ids, b, c, t, d, 0.0, p, None)
+
+
+def step_tweens(ease_ids, begin, change, t, d, dt, p=None, out=None):
+    """
+    Advances the times t by dt and computes the values at the new times in the same kernel pass, like an update of
+    the tweener for tweens kept in arrays. Arguments as for tweens_at, except t, which has to be a contiguous
+    float64 numpy array (it is changed in place), and dt, the time step. The values are written into out if given
+    (same buffers as for tween_at).
+
+    :return: out if given, else the values at the new times t as numpy array
+    """
+    if not isinstance(t, np.ndarray) or t.dtype != np.float64 or not t.flags.c_contiguous:
+        raise ValueError("t has to be a contiguous float64 numpy array to be advanced in place")
+    b, c, d = (np.ascontiguousarray(np.broadcast_to(np.asarray(_v, dtype=np.float64), t.shape))
+               for _v in (begin, change, d))
+    ease_ids = np.ascontiguousarray(np.broadcast_to(np.asarray(ease_ids, dtype=np.int64), t.shape))
+    return _tweens_at(ease_ids, b, c, t, d, float(dt), p, out)
+
+
+def _tweens_at(ease_ids, b, c, t, d, dt, p, out):
+    # -1 (custom ease function) would index the last entry of the table, so the ids are checked first
+    if ease_ids.size and (ease_ids.min() < 0 or ease_ids.max() >= len(tweening.ease_functions)):
+        raise ValueError("ease ids have to be ids from game.tweening.EASE_IDS, custom ease functions are not supported")
+    kinds = _KINDS_BY_EASE_ID[ease_ids]
+    count = t.shape[0]
+    values = out if _is_kernel_buffer(out, count) else np.empty(count, dtype=np.float64)
+    _ease_kernel(kinds, t, b, c, d, dt, values)
+    unsupported = kinds < 0
+    if unsupported.any():
+        for ease_id in np.unique(ease_ids[unsupported]):
+            mask = ease_ids == ease_id
+            values[mask] = tweening.tween_at(b[mask], c[mask], t[mask], d[mask], int(ease_id), p)
+    return _copy_to_out(values, out)
+
+
+def _is_kernel_buffer(out, count):
+    # the kernel only writes directly into a matching numpy array
+    return (isinstance(out, np.ndarray) and out.dtype == np.float64 and out.flags.c_contiguous
+            and out.shape == (count,))
+
+
+def _copy_to_out(values, out):
+    # for out buffers the kernel can not write into (e.g. array('d') or list), as game.tweening.tween_at does
+    if out is None or out is values:
+        return values
+    if isinstance(out, array):
+        values = array(out.typecode, values)  # an array slice can only be assigned from an array of the same type
+    out[:] = values
+    return out
+
+
+logger.debug("imported")
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from game import tweening  # noqa: E402
+from game import tweening_numba  # noqa: E402
+
+
+@pytest.mark.parametrize("ease_id", [-1, len(tweening.ease_functions)])
+def test_tweens_at_raises_for_ids_not_in_ease_ids(ease_id):
+    with pytest.raises(ValueError):
+        tweening_numba.tweens_at([ease_id] * 4, np.zeros(4), np.ones(4), np.linspace(0.0, 1.0, 4), np.ones(4))
+
+
+@pytest.mark.parametrize("ease_id", [-1, len(tweening.ease_functions)])
+def test_step_tweens_raises_for_ids_not_in_ease_ids(ease_id):
+    t = np.zeros(4)
+    with pytest.raises(ValueError):
+        tweening_numba.step_tweens([ease_id] * 4, 0.0, 1.0, t, 1.0, 0.1)
+
+
+def test_tweens_at_computes_supported_and_fallback_ids():
+    eases = [tweening.ease_in_quad, tweening.ease_out_bounce]
+    ease_ids = [tweening.EASE_IDS[_e] for _e in eases]
+
+    values = tweening_numba.tweens_at(ease_ids, 0.0, 1.0, 0.5, 1.0)
+
+    expected = [_e(0.5, 0.0, 1.0, 1.0, None) for _e in eases]
+    assert values == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("make_out", [
+    lambda: np.zeros(5),
+    lambda: np.zeros(5, dtype=np.float32),
+    lambda: np.zeros((5, 2))[:, 0],
+    lambda: array('d', [0.0] * 5),
+    lambda: [0.0] * 5,
+])
+def test_tween_at_writes_into_out(make_out):
+    t = np.linspace(0.0, 1.0, 5)
+    out = make_out()
+
+    result = tweening_numba.tween_at(0.0, 10.0, t, 1.0, tweening.ease_in_quad, out=out)
+
+    assert result is out
+    assert list(out) == pytest.approx([tweening.ease_in_quad(_t, 0.0, 10.0, 1.0, None) for _t in t], rel=1e-6)
+
+
+def test_step_tweens_writes_into_out():
+    t = np.zeros(2)
+    out = array('d', [0.0, 0.0])
+    ease_ids = [tweening.EASE_IDS[tweening.ease_in_quad], tweening.EASE_IDS[tweening.ease_out_bounce]]
+
+    result = tweening_numba.step_tweens(ease_ids, 0.0, 1.0, t, 1.0, 0.5, out=out)
+
+    assert result is out
+    assert list(out) == pytest.approx([0.25, tweening.ease_out_bounce(0.5, 0.0, 1.0, 1.0, None)])